@@ -32,5 +32,6 @@ PyInstaller.__main__.run(
         "--add-data=assets/fonts;assets/fonts",
         "--add-data=assets/icon.png;assets",
         "--icon=assets/icon.ico",
+        "--exclude-module=tkinter",
     ]
 )
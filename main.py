@@ -33,6 +33,7 @@ REQUIRED_FOLDERS = ["bin", "config", "logs"] # List of required folders that mus
 WIN11_LOWEST_BUILD = 22000 # Lowest build number of Windows 11
 LOG_MULT = 60 # Amount of = to put in the logs as seperators
 MB_ICONERROR = 0x10 # Windows error messagebox flag
+MB_ICONWARNING = 0x30 # Windows warning messagebox flag
 
 def setup_logging():
     """
@@ -70,23 +71,19 @@ def check_windows_version():
             logger.warning(f"Windows 10 detected (Build {build}) - showing warning message")
             # Show warning
             try:
-                import tkinter as tk
-                from tkinter import messagebox
-
-                root = tk.Tk()
-                root.withdraw()
-                messagebox.showwarning(
-                    "Windows 10 Detected - Known Issues",
+                ctypes.windll.user32.MessageBoxW(
+                    None,
                     f"WARNING: You are running Windows 10 (Build {build})\n\n"
                     f"ThorCPY has been reported to have stability issues on Windows 10.\n"
                     f"Restarting ThorCPY can sometimes fix small issues.\n"
                     f"For the best experience, please use Windows 11.\n\n"
                     f"Continue anyway?",
+                    "Windows 10 Detected - Known Issues",
+                    MB_ICONWARNING
                 )
-                root.destroy()
-            except Exception as tkErr:
+            except Exception as MessageBoxErr:
                 # Fallback to console message if the messagebox doesn't work
-                logger.error(f"GUI warning message failed: {tkErr}")
+                logger.error(f"GUI warning message failed: {MessageBoxErr}")
                 print("=" * LOG_MULT)
                 print("WARNING: Windows 10 Detected - Unstable Build with Known Issues")
                 print("=" * LOG_MULT)
@@ -98,7 +95,7 @@ def check_windows_version():
                 print("")
                 print("For the best experience, please use Windows 11.")
                 print("=" * LOG_MULT)
-                print(f"(GUI warning failed: {tkErr})")
+                print(f"(GUI warning failed: {MessageBoxErr})")
                 input("\nPress Enter to continue anyway...")
         else:
             logger.info(f"Windows 11 detected (Build {build})")
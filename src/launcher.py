@@ -38,6 +38,10 @@ logger = logging.getLogger(__name__)
 # Win32 window message constants
 WM_CLOSE = 0x0010
 WM_DESTROY = 0x0002
+WM_WINDOWPOSCHANGED = 0x0047
+
+# SetWindowPos flag that marks a WINDOWPOS as not carrying a new position
+SWP_NOMOVE = 0x0002
 
 # Win32 window style constants
 WS_OVERLAPPEDWINDOW = 0x00CF0000
@@ -70,7 +74,11 @@ DEFAULT_CONTAINER_Y = 100
 # Timing constants
 SCRCPY_POLL_INTERVAL = 0.1
 DOCKING_MONITOR_TIME_DELAY = 0.5
-UI_FPS = 60
+UI_FPS = 30
+UI_DRAG_FPS = 60  # Frame cap while a slider is being dragged
+UI_EVENT_WAIT_MS = 1000 // UI_FPS  # Longest the loop blocks waiting for input
+UI_DRAG_EVENT_WAIT_MS = 1000 // UI_DRAG_FPS  # Longest block while dragging, where mouse motion is polled rather than queued
+UI_IDLE_EVENT_WAIT_MS = 100  # Longest block while nothing is being dragged, typed, clicked or hovered (~10 fps)
 
 # Math constants
 HALF = 0.5
@@ -80,6 +88,20 @@ DEFAULT_LAYOUT = {"tx": TOP_SCREEN_DEFAULT_X, "ty": TOP_SCREEN_DEFAULT_Y,
                   "bx": BOTTOM_SCREEN_DEFAULT_X, "by": BOTTOM_SCREEN_DEFAULT_Y,
                   "global_scale": DEFAULT_GLOBAL_SCALE}
 
+
+# lParam of WM_WINDOWPOSCHANGED
+class WINDOWPOS(ctypes.Structure):
+    _fields_ = [
+        ("hwnd", wintypes.HWND),
+        ("hwndInsertAfter", wintypes.HWND),
+        ("x", ctypes.c_int),
+        ("y", ctypes.c_int),
+        ("cx", ctypes.c_int),
+        ("cy", ctypes.c_int),
+        ("flags", wintypes.UINT),
+    ]
+
+
 class Launcher:
     """
     Main window controller for ThorCPY
@@ -174,6 +196,7 @@ class Launcher:
         """
         Creates a windows procedure callback for the window
         Handles window messaged like WM_CLOSE and WM_DESTROY by calling stop()
+        and passes container moves on to the dock, so undocked syncs don't have to query them
         Returns:
             WNDPROC: Window procedure callback function
         """
@@ -185,6 +208,10 @@ class Launcher:
             if msg in (WM_CLOSE, WM_DESTROY):
                 self.stop()
                 return 0
+            if msg == WM_WINDOWPOSCHANGED:
+                pos = WINDOWPOS.from_address(lp)
+                if not pos.flags & SWP_NOMOVE:
+                    self.dock.set_container_origin(pos.x, pos.y)
             return self.user32.DefWindowProcW(hwnd, msg, wp, lp)
 
         return WNDPROC(py_wndproc)
@@ -292,12 +319,14 @@ class Launcher:
                         self.user32.SetParent(topScr, self.hwnd_container)
                         apply_docked_style(topScr)
                         self.dock.hwnd_top = topScr
+                        self.dock.invalidate_geometry()
 
                     # Dock top screen if found and not already docked
                     if bottomScr and self.user32.GetParent(bottomScr) != self.hwnd_container:
                         self.user32.SetParent(bottomScr, self.hwnd_container)
                         apply_docked_style(bottomScr)
                         self.dock.hwnd_bottom = bottomScr
+                        self.dock.invalidate_geometry()
             time.sleep(DOCKING_MONITOR_TIME_DELAY)
 
     def toggle_dock(self):
@@ -318,6 +347,7 @@ class Launcher:
 
                 apply_undocked_style(self.dock.hwnd_top)
                 apply_undocked_style(self.dock.hwnd_bottom)
+                self.dock.invalidate_geometry()
                 self.user32.ShowWindow(self.hwnd_container, SW_HIDE)
 
                 logger.info("Windows undocked successfully")
@@ -329,6 +359,7 @@ class Launcher:
                 self.user32.SetParent(self.dock.hwnd_bottom, self.hwnd_container)
                 apply_docked_style(self.dock.hwnd_top)
                 apply_docked_style(self.dock.hwnd_bottom)
+                self.dock.invalidate_geometry()
                 self.docked = True
 
                 logger.info("Windows docked successfully")
@@ -369,32 +400,51 @@ class Launcher:
         # Init UI and event loop
         from src.ui_pygame import PygameUI
 
-        pygame.init()
+        if not pygame.get_init():
+            pygame.init()
         self.ui = PygameUI(self)
         clock = pygame.time.Clock()
 
-        while self.running:
-            # Handle pygame events
-            for event in pygame.event.get():
-                if event.type == pygame.QUIT:
-                    self.stop()
-                self.ui.handle_event(event)
-
-            # Sync window positions if they exist
-            if self.dock.hwnd_top or self.dock.hwnd_bottom:
-                self.dock.sync(
-                    self.tx,
-                    self.ty,
-                    self.bx,
-                    self.by,
-                    self.scrcpy.f_w1,
-                    self.scrcpy.f_h1,
-                    self.scrcpy.f_w2,
-                    self.scrcpy.f_h2,
-                    is_docked=self.docked,
-                )
-            self.ui.render()
-            clock.tick(UI_FPS)
+        # Rendering and input handling don't guard themselves; any unexpected error ends up here
+        # once, and still shuts scrcpy down instead of leaving it running headless
+        try:
+            while self.running:
+                # Block until input arrives (or a frame period passes), then drain the queue.
+                # An idle panel blocks longer; any queued event still wakes it immediately.
+                # A drag queues no events (MOUSEMOTION is blocked), so its wait sets the drag frame rate
+                if self.ui.dragging:
+                    wait_ms = UI_DRAG_EVENT_WAIT_MS
+                elif self.ui.is_interactive():
+                    wait_ms = UI_EVENT_WAIT_MS
+                else:
+                    wait_ms = UI_IDLE_EVENT_WAIT_MS
+                event = pygame.event.wait(wait_ms)
+                if event.type != pygame.NOEVENT:
+                    # Everything else that queued up comes out in one event.get() call
+                    for event in (event, *pygame.event.get()):
+                        if event.type == pygame.QUIT:
+                            self.stop()
+                        self.ui.handle_event(event)
+                self.ui.poll_mouse()
+
+                # Sync window positions if they exist
+                if self.dock.hwnd_top or self.dock.hwnd_bottom:
+                    self.dock.sync(
+                        self.tx,
+                        self.ty,
+                        self.bx,
+                        self.by,
+                        self.scrcpy.f_w1,
+                        self.scrcpy.f_h1,
+                        self.scrcpy.f_w2,
+                        self.scrcpy.f_h2,
+                        is_docked=self.docked,
+                    )
+                self.ui.render()
+                clock.tick(UI_DRAG_FPS if self.ui.dragging else UI_FPS)
+        except Exception as MainLoopError:
+            logger.critical(f"Unhandled error in UI loop: {MainLoopError}", exc_info=True)
+            self.stop()
 
     def stop(self):
         """
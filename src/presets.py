@@ -21,6 +21,7 @@ import json
 import os
 import re
 import logging
+import threading
 
 # Validation Constants
 MAX_PRESET_NAME_LENGTH = 50
@@ -29,6 +30,7 @@ INVALID_CHARS = r'[<>:"/\\|?*\x00-\x1f]'
 # JSON formatting constants
 JSON_INDENT = 4
 DEFAULT_ENCODING = "utf-8"
+TEMP_FILE_SUFFIX = ".tmp"
 
 
 logger = logging.getLogger(__name__)
@@ -51,6 +53,13 @@ class PresetStore:
         logger.info(f"Initializing PresetStore with path: {path}")
         self.path = path
 
+        # In-memory copy of the preset file and the (mtime, size) it was read at. The UI thread
+        # saves and deletes while the preset loader thread reads, so both go through the lock
+        # (reentrant, since saving and deleting load the presets first)
+        self._cache = None
+        self._cache_stamp = None
+        self._lock = threading.RLock()
+
         # Create directory structure if necessary
         try:
             dir_path = os.path.dirname(self.path)
@@ -69,6 +78,47 @@ class PresetStore:
                 f"Preset file does not exist yet (will be created on first save): {self.path}"
             )
 
+    def _file_stamp(self):
+        """
+        Get a cheap change marker for the preset file.
+
+        Returns:
+            tuple or None: (mtime_ns, size), or None if the file doesn't exist
+        """
+        try:
+            stat = os.stat(self.path)
+        except OSError:
+            return None
+        return stat.st_mtime_ns, stat.st_size
+
+    def _write_presets(self, presets):
+        """
+        Atomically replace the preset file with the given presets. Called with the lock held.
+
+        The JSON is written in one call to a temp file, flushed to disk and then swapped in
+        with os.replace, so a failed write never leaves a truncated preset file behind.
+
+        Args:
+            presets: Dictionary of all presets to persist
+        """
+        tmp_path = self.path + TEMP_FILE_SUFFIX
+        payload = json.dumps(presets, indent=JSON_INDENT).encode(DEFAULT_ENCODING)
+        try:
+            with open(tmp_path, "wb") as file:
+                file.write(payload)
+                file.flush()
+                os.fsync(file.fileno())
+            os.replace(tmp_path, self.path)
+        except Exception:
+            try:
+                os.remove(tmp_path)
+            except OSError:
+                pass
+            raise
+
+        self._cache = presets
+        self._cache_stamp = self._file_stamp()
+
     @staticmethod
     def validate_preset_name(name):
         """
@@ -132,35 +182,35 @@ class PresetStore:
             logger.error(f"Invalid preset name '{name}': {error}")
             raise ValueError(error)
 
-        try:
-            # Load existing presets
-            presets = self.load_all()
+        with self._lock:
+            try:
+                # Load existing presets
+                presets = self.load_all()
 
-            # Check if overwriting
-            if name in presets:
-                logger.info(f"Overwriting existing preset: '{name}'")
-            else:
-                logger.info(f"Creating new preset: '{name}'")
+                # Check if overwriting
+                if name in presets:
+                    logger.info(f"Overwriting existing preset: '{name}'")
+                else:
+                    logger.info(f"Creating new preset: '{name}'")
 
-            # Add/update preset
-            presets[name] = data
+                # Add/update preset
+                presets[name] = data
 
-            # Save to file
-            logger.debug(f"Writing presets to {self.path}")
-            with open(self.path, "w", encoding=DEFAULT_ENCODING) as file:
-                json.dump(presets, file, indent=JSON_INDENT)
+                # Save to file
+                logger.debug(f"Writing presets to {self.path}")
+                self._write_presets(presets)
 
-            logger.info(f"Successfully saved preset '{name}' with data: {data}")
+                logger.info(f"Successfully saved preset '{name}' with data: {data}")
 
-        except PermissionError as PresetLoadingError:
-            logger.error(f"Permission denied writing to {self.path}: {PresetLoadingError}")
-            raise
-        except IOError as FileIOError:
-            logger.error(f"IO error saving preset '{name}': {FileIOError}", exc_info=True)
-            raise
-        except Exception as PresetSaveError:
-            logger.error(f"Unexpected error saving preset '{name}': {PresetSaveError}", exc_info=True)
-            raise
+            except PermissionError as PresetLoadingError:
+                logger.error(f"Permission denied writing to {self.path}: {PresetLoadingError}")
+                raise
+            except IOError as FileIOError:
+                logger.error(f"IO error saving preset '{name}': {FileIOError}", exc_info=True)
+                raise
+            except Exception as PresetSaveError:
+                logger.error(f"Unexpected error saving preset '{name}': {PresetSaveError}", exc_info=True)
+                raise
 
     def delete_preset(self, name):
         """
@@ -178,74 +228,86 @@ class PresetStore:
         """
         logger.info(f"Attempting to delete preset: '{name}'")
 
-        try:
-            presets = self.load_all()
-
-            if name in presets:
-                del presets[name]
-                logger.debug(f"Preset '{name}' removed from dictionary")
-
-                # Save updated presets
-                with open(self.path, "w", encoding=DEFAULT_ENCODING) as file:
-                    json.dump(presets, file, indent=JSON_INDENT)
-
-                logger.info(f"Successfully deleted preset: '{name}'")
-                return True
-            else:
-                logger.warning(f"Cannot delete preset '{name}': does not exist")
-                return False
-
-        except PermissionError as PresetDeleteError:
-            logger.error(f"Permission denied writing to {self.path}: {PresetDeleteError}")
-            raise
-        except IOError as FileIOError:
-            logger.error(f"IO error deleting preset '{name}': {FileIOError}", exc_info=True)
-            raise
-        except Exception as PresetDeleteError:
-            logger.error(f"Unexpected error deleting preset '{name}': {PresetDeleteError}", exc_info=True)
-            raise
+        with self._lock:
+            try:
+                presets = self.load_all()
+
+                if name in presets:
+                    del presets[name]
+                    logger.debug(f"Preset '{name}' removed from dictionary")
+
+                    # Save updated presets
+                    self._write_presets(presets)
+
+                    logger.info(f"Successfully deleted preset: '{name}'")
+                    return True
+                else:
+                    logger.warning(f"Cannot delete preset '{name}': does not exist")
+                    return False
+
+            except PermissionError as PresetDeleteError:
+                logger.error(f"Permission denied writing to {self.path}: {PresetDeleteError}")
+                raise
+            except IOError as FileIOError:
+                logger.error(f"IO error deleting preset '{name}': {FileIOError}", exc_info=True)
+                raise
+            except Exception as PresetDeleteError:
+                logger.error(f"Unexpected error deleting preset '{name}': {PresetDeleteError}", exc_info=True)
+                raise
 
     def load_all(self):
         """
         Load all presets from disk.
 
-        Handles missing files and corrupted JSON with an empty dict. Validates dictionary
+        Handles missing files and corrupted JSON with an empty dict. Validates that the file
+        holds a dictionary.
+
+        The parsed file is kept in memory and only re-read when its mtime or size changes.
+        Safe to call from any thread.
 
         Returns:
             dict: Dictionary of all presets, or empty dict if file doesn't exist or is invalid
         """
-        if not os.path.exists(self.path):
-            logger.debug(
-                f"Preset file does not exist: {self.path}, returning empty dict"
-            )
-            return {}
+        with self._lock:
+            stamp = self._file_stamp()
+            if stamp is None:
+                logger.debug(
+                    f"Preset file does not exist: {self.path}, returning empty dict"
+                )
+                return {}
 
-        try:
-            logger.debug(f"Loading presets from {self.path}")
-            with open(self.path, "r", encoding=DEFAULT_ENCODING) as file:
-                presets = json.load(file)
+            # Callers get their own dict so they can modify it freely
+            if self._cache is not None and stamp == self._cache_stamp:
+                return dict(self._cache)
 
-            # Validate structure
-            if not isinstance(presets, dict):
-                logger.error(f"Preset file contains invalid data type: {type(presets)}")
-                return {}
+            try:
+                logger.debug(f"Loading presets from {self.path}")
+                with open(self.path, "r", encoding=DEFAULT_ENCODING) as file:
+                    presets = json.load(file)
+
+                # Validate structure
+                if not isinstance(presets, dict):
+                    logger.error(f"Preset file contains invalid data type: {type(presets)}")
+                    return {}
 
-            logger.debug(f"Loaded {len(presets)} preset(s) from disk: {list(presets.keys())}")
-            return presets
-
-        except json.JSONDecodeError as JSONDecodeError:
-            logger.error(f"JSON decode error reading {self.path}: {JSONDecodeError}", exc_info=True)
-            logger.warning("Returning empty preset dictionary due to corrupted file")
-            return {}
-        except PermissionError as ErrorLoadingPresets:
-            logger.error(f"Permission denied reading {self.path}: {ErrorLoadingPresets}")
-            return {}
-        except IOError as FileIOError:
-            logger.error(f"IO error reading presets: {FileIOError}", exc_info=True)
-            return {}
-        except Exception as PresetSaveError:
-            logger.error(f"Unexpected error loading presets: {PresetSaveError}", exc_info=True)
-            return {}
+                logger.debug(f"Loaded {len(presets)} preset(s) from disk: {list(presets.keys())}")
+                self._cache = presets
+                self._cache_stamp = stamp
+                return dict(presets)
+
+            except json.JSONDecodeError as JSONDecodeError:
+                logger.error(f"JSON decode error reading {self.path}: {JSONDecodeError}", exc_info=True)
+                logger.warning("Returning empty preset dictionary due to corrupted file")
+                return {}
+            except PermissionError as ErrorLoadingPresets:
+                logger.error(f"Permission denied reading {self.path}: {ErrorLoadingPresets}")
+                return {}
+            except IOError as FileIOError:
+                logger.error(f"IO error reading presets: {FileIOError}", exc_info=True)
+                return {}
+            except Exception as PresetSaveError:
+                logger.error(f"Unexpected error loading presets: {PresetSaveError}", exc_info=True)
+                return {}
 
     def get_preset(self, name):
         """
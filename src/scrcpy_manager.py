@@ -17,18 +17,30 @@
 
 # src/scrcpy_manager.py
 
+import ctypes
 import os
 import subprocess
+import sys
+import threading
 import time
 import shutil
 import logging
+from concurrent.futures import ThreadPoolExecutor
+from ctypes import wintypes
 
 # Setup logger for this module
 logger = logging.getLogger(__name__)
 
+# Win32 DLLs (process handle waits are only available on Windows)
+kernel32 = ctypes.windll.kernel32 if sys.platform == "win32" else None
+
 # Process creation flags
 CREATE_NO_WINDOW = 0x08000000 # Prevents console window from appearing
 
+# Spawn options shared by every subprocess in this module.
+# close_fds is left at its default so each child only inherits its own pipe handles
+SUBPROCESS_KWARGS = {"creationflags": CREATE_NO_WINDOW} if sys.platform == "win32" else {}
+
 # Default UI scaling
 DEFAULT_UI_SCALING = 0.6
 
@@ -51,14 +63,33 @@ ADB_CAPTURE_OUTPUT = True
 ADB_SERVER_TIMEOUT = 10
 ADB_TASKKILL_TIMEOUT = 5
 
+# adb stderr when the device is gone; device cleanup stops after the first call if it sees one
+ADB_DEVICE_GONE_MARKERS = ("not found", "offline", "no devices")
+
+# Device-side cleanup, batched into one adb shell invocation. The bracketed patterns keep pkill
+# from matching the wrapping shell, whose own command line contains the script text
+DEVICE_CLEANUP_SHELL_SCRIPT = "pkill -f '[s]crcpy-server'; pkill -f '[a]pp_process'"
+
 # Logging constants
 LOG_MULT = 60 # Width of log separator lines
+LOG_SEPARATOR = "=" * LOG_MULT
 LOGFILE_ENCODING = "utf-8"
+LOG_PUMP_JOIN_TIMEOUT = 0.5  # Max wait for an output pump to flush after its process exits
 
 # Scrcpy default parameters
 DEFAULT_MAX_FPS = "120"
 DEFAULT_RENDER_DRIVER = "opengl"
 
+# Fixed arguments shared by both windows
+SCRCPY_BASE_ARGS = (
+    "--window-borderless",
+    "--max-fps",
+    DEFAULT_MAX_FPS,
+    "--render-driver",
+    DEFAULT_RENDER_DRIVER,
+    "--mouse-bind=++++", # Enable all mouse bindings
+)
+
 # Video bitrate calculation constants
 BITRATE_CALC_SCALE_FACTOR = 1.5
 TOP_BITRATE_MINIMUM = 8
@@ -73,14 +104,103 @@ BOTTOM_SCREEN_DISPLAY_ID = "4"
 BOTTOM_SCREEN_WINDOW_TITLE = "ThorCPY Bottom Screen"
 
 # Timing delays for process management
-DISPLAY_INIT_DELAY = 1.2  # Wait for first display to initialize
-SCRCPY_CREATION_DELAY = 0.3  # Check if process survives startup
-SCRCPY_RETRY_DELAY = 0.7  # Wait between retry attempts
+BOTTOM_LAUNCH_STAGGER = 0.2  # Head start given to the top display before launching the bottom one
+SCRCPY_CREATION_DELAY = 0.3  # Window in which an early exit counts as a failed start
+SCRCPY_RETRY_BASE_DELAY = 0.1  # First retry backoff, doubled on each further attempt
+SCRCPY_RETRY_MAX_DELAY = 1.0  # Cap on the retry backoff
 
 # Process termination timeouts
 PROCESS_TERMINATE_TIMEOUT = 2
 SCRCPY_TERMINATE_TIMEOUT = 3
 
+# WaitForMultipleObjects constants
+WAIT_OBJECT_0 = 0x00000000
+WAIT_TIMEOUT = 0x00000102
+WAIT_FAILED = 0xFFFFFFFF
+MAXIMUM_WAIT_OBJECTS = 64  # Win32 limit on handles per wait call
+
+if kernel32:
+    kernel32.WaitForMultipleObjects.argtypes = [
+        wintypes.DWORD, ctypes.POINTER(wintypes.HANDLE), wintypes.BOOL, wintypes.DWORD
+    ]
+    kernel32.WaitForMultipleObjects.restype = wintypes.DWORD
+
+
+def _wait_all_processes(processes, timeout):
+    """
+    Wait for every process to exit using one WaitForMultipleObjects call per 64 handles.
+
+    Args:
+        processes: List of Popen objects
+        timeout: Total time to wait in seconds
+
+    Returns:
+        True if all exited, False on timeout, None if unsupported (non-Windows or wait failure)
+    """
+    if not kernel32:
+        return None
+
+    handles = [int(process._handle) for process in processes]
+    deadline = time.monotonic() + timeout
+
+    for i in range(0, len(handles), MAXIMUM_WAIT_OBJECTS):
+        chunk = handles[i:i + MAXIMUM_WAIT_OBJECTS]
+        remaining_ms = max(0, int((deadline - time.monotonic()) * 1000))
+        result = kernel32.WaitForMultipleObjects(
+            len(chunk), (wintypes.HANDLE * len(chunk))(*chunk), True, remaining_ms
+        )
+        if result == WAIT_TIMEOUT:
+            return False
+        if result == WAIT_FAILED:
+            logger.warning(f"WaitForMultipleObjects failed (error {ctypes.GetLastError()})")
+            return None
+
+    return True
+
+
+def _find_exited_process(processes):
+    """
+    Find an exited process by testing every handle in one non-blocking WaitForMultipleObjects call.
+
+    Args:
+        processes: List of Popen objects
+
+    Returns:
+        Index of an exited process, None if all are running, or False if unsupported
+        (non-Windows, more than 64 processes, or wait failure)
+    """
+    if not kernel32 or not processes or len(processes) > MAXIMUM_WAIT_OBJECTS:
+        return False
+
+    handles = [int(process._handle) for process in processes]
+    result = kernel32.WaitForMultipleObjects(
+        len(handles), (wintypes.HANDLE * len(handles))(*handles), False, 0
+    )
+    if result == WAIT_TIMEOUT:
+        return None
+    if WAIT_OBJECT_0 <= result < WAIT_OBJECT_0 + len(handles):
+        return result - WAIT_OBJECT_0
+    return False
+
+
+def _pump_output(pipe, logfile):
+    """
+    Copy a child process's output pipe into its log file until EOF.
+
+    Args:
+        pipe: Binary stdout pipe of the child
+        logfile: Binary log file to write to
+    """
+    with pipe:
+        for line in iter(pipe.readline, b""):
+            try:
+                logfile.write(line)
+                logfile.flush()
+            except (OSError, ValueError):
+                # Keep draining even if the log can't be written so the child never blocks
+                pass
+
+
 # Main ScrcpyManager class
 class ScrcpyManager:
     """
@@ -88,6 +208,12 @@ class ScrcpyManager:
     Handles device detection, window launching, scaling, resolution and process management and shutdown
     """
 
+    # Resolved binary paths shared by all instances, keyed by (cwd, name)
+    _bin_cache = {}
+
+    # Set once any adb call proves the daemon is running, shared by all instances
+    _adb_server_ready = False
+
     def __init__(self, scale=DEFAULT_UI_SCALING, scrcpy_bin=None, adb_bin=None, enable_audio_top=True):
         """
         Initialize the scrcpy manager.
@@ -102,6 +228,8 @@ class ScrcpyManager:
 
         self.scale = scale
         self.processes = [] # Track all scrcpy subprocess instances
+        self._processes_lock = threading.Lock() # Guards self.processes during parallel launches
+        self._log_pumps = [] # (thread, logfile) pairs draining scrcpy output into logs
         self.serial = None
         self.enable_audio_top = enable_audio_top
 
@@ -118,6 +246,11 @@ class ScrcpyManager:
         self.f_h2 = int(BOTTOM_HEIGHT_SCALE_FACTOR * pxi)
         logger.debug(f"Bottom window resolution: {self.f_w2}x{self.f_h2}")
 
+        # Calculate bitrates based on resolution (fixed for the manager's lifetime)
+        bitrate_scale = self.scale ** BITRATE_CALC_SCALE_FACTOR
+        self._bitrate_top = f"{max(TOP_BITRATE_MINIMUM, int(TOP_BITRATE_SCALE * bitrate_scale))}M"
+        self._bitrate_bottom = f"{max(BOTTOM_BITRATE_MINIMUM, int(BOTTOM_BITRATE_SCALE * bitrate_scale))}M"
+
         # Locate scrcpy and adb binaries
         self.scrcpy_bin = scrcpy_bin or self._resolve_bin("scrcpy")
         self.adb_bin = adb_bin or self._resolve_bin("adb")
@@ -137,9 +270,18 @@ class ScrcpyManager:
         self.scrcpy_start_delay = SCRCPY_START_DELAY
         logger.debug(f"Retry count: {self.scrcpy_retry_count}, Start delay: {self.scrcpy_start_delay}s")
 
+        # Scrcpy output log directory, created once up front
+        self.logs_dir = os.path.join(os.getcwd(), "logs")
+        try:
+            os.makedirs(self.logs_dir, exist_ok=True)
+        except Exception as LogDirCreationError:
+            logger.warning(f"Failed to create scrcpy log directory: {LogDirCreationError}")
+        self._session_stamp = None # Timestamp shared by all log files of one start_scrcpy call
+
     def _resolve_bin(self, name):
         """
         Finds binary in local ./bin folder or system path.
+        Results are cached per working directory, see refresh_bins().
 
         Args:
             name: Binary name (e.g., "scrcpy" or "adb")
@@ -147,29 +289,42 @@ class ScrcpyManager:
         Returns:
             Full path to binary or None if not found
         """
+        cwd = os.getcwd()
+        key = (cwd, name)
+        if key in self._bin_cache:
+            logger.debug(f"Using cached path for {name}: {self._bin_cache[key]}")
+            return self._bin_cache[key]
+
         logger.debug(f"Resolving binary: {name}")
 
         # Check local bin folder first
-        local = os.path.join(os.getcwd(), "bin", f"{name}.exe")
+        local = os.path.join(cwd, "bin", f"{name}.exe")
         if os.path.exists(local):
             logger.info(f"Found {name} in local bin folder: {local}")
-            return local
+            found = local
+        else:
+            # Fallback to system PATH
+            found = shutil.which(name)
+            if found:
+                logger.info(f"Found {name} in system PATH: {found}")
+            else:
+                logger.warning(f"Binary '{name}' not found in local bin or system PATH")
 
-        # Fallback to system PATH
-        found = shutil.which(name)
-        if found:
-            logger.info(f"Found {name} in system PATH: {found}")
-            return found
+        self._bin_cache[key] = found
+        return found
 
-        logger.warning(f"Binary '{name}' not found in local bin or system PATH")
-        return None
+    @classmethod
+    def refresh_bins(cls):
+        """Clear the cached binary paths so the next lookup rescans the filesystem"""
+        cls._bin_cache.clear()
+        logger.debug("Binary path cache cleared")
 
 
     def detect_device(self):
         """
         Detect and return serial of first connected Android ADB device.
 
-        Starts ADB server if needed, then queries for authorized devices.
+        Starts ADB server if it isn't known to be running, then queries for authorized devices.
         Ignores unauthorized devices to prevent connection issues.
 
         Returns:
@@ -185,7 +340,26 @@ class ScrcpyManager:
             logger.error("Cannot detect device: ADB binary not found")
             return None
 
-        # Start ADB server
+        # Skip start-server if an earlier adb call already proved the daemon is running
+        server_assumed_ready = ScrcpyManager._adb_server_ready
+        if server_assumed_ready:
+            logger.debug("ADB server already running, skipping start-server")
+        else:
+            self._start_adb_server()
+
+        serial, failed = self._query_devices()
+
+        # The daemon may have died since we last saw it, so start it explicitly and retry once
+        if failed and server_assumed_ready:
+            logger.info("ADB devices query failed, starting ADB server and retrying")
+            ScrcpyManager._adb_server_ready = False
+            self._start_adb_server()
+            serial, failed = self._query_devices()
+
+        return serial
+
+    def _start_adb_server(self):
+        """Run 'adb start-server' and record whether the daemon is ready"""
         try:
             logger.debug("Starting ADB server")
             result = subprocess.run(
@@ -193,38 +367,64 @@ class ScrcpyManager:
                 capture_output=ADB_CAPTURE_OUTPUT,
                 text=True,
                 timeout=ADB_SERVER_TIMEOUT,
+                **SUBPROCESS_KWARGS,
             )
             if result.returncode != 0:
                 logger.warning(f"ADB start-server returned code {result.returncode}")
             else:
+                ScrcpyManager._adb_server_ready = True
                 logger.debug("ADB server started successfully")
         except subprocess.TimeoutExpired:
             logger.error("ADB start-server timed out")
         except Exception as ADBStartError:
             logger.error(f"Failed to start ADB server: {ADBStartError}", exc_info=True)
 
-        # Query for devices
+    def _query_devices(self):
+        """
+        Query 'adb devices', streaming output and stopping at the first authorized device.
+
+        Returns:
+            tuple: (serial or None, failed: bool) where failed means the adb command itself failed
+        """
         try:
             logger.debug("Querying connected devices")
-            out = subprocess.check_output([self.adb_bin, "devices"], text=True, timeout=ADB_SERVER_TIMEOUT)
-            logger.debug(f"ADB devices output:\n{out}")
+            cmd = [self.adb_bin, "devices"]
+            proc = subprocess.Popen(cmd, stdout=subprocess.PIPE, text=True, **SUBPROCESS_KWARGS)
 
-            # Parse device list (skip header line)
-            lines = out.strip().splitlines()[1:]
-            devices = [
-                line.split()[0] for line in lines if "device" in line and "unauthorized" not in line
-            ]
+            # Kill adb if it hangs so the read loop below can't block forever
+            watchdog = threading.Timer(ADB_SERVER_TIMEOUT, proc.kill)
+            watchdog.start()
 
-            if devices:
-                self.serial = devices[0]
+            try:
+                next(proc.stdout, None)  # Skip header line
+                for line in proc.stdout:
+                    logger.debug("ADB devices line: %s", line.rstrip())
+                    # Only a "device" state column is usable, skip unauthorized/offline entries
+                    parts = line.split()
+                    if len(parts) >= 2 and parts[1] == "device":
+                        self.serial = parts[0]
+                        break
+            finally:
+                timed_out = watchdog.finished.is_set()
+                watchdog.cancel()
+                if proc.poll() is None:
+                    proc.terminate()
+                # Drain any remaining output so adb never blocks on a full pipe
+                proc.communicate()
+
+            if self.serial:
+                ScrcpyManager._adb_server_ready = True
                 logger.info(f"Device detected: {self.serial}")
-                if len(devices) > 1:
-                    logger.info(
-                        f"Multiple devices found ({len(devices)}), using first: {self.serial}"
-                    )
-                return self.serial
-            else:
-                logger.warning("No devices found in ADB device list")
+                return self.serial, False
+
+            if timed_out:
+                raise subprocess.TimeoutExpired(cmd, ADB_SERVER_TIMEOUT)
+            if proc.returncode:
+                raise subprocess.CalledProcessError(proc.returncode, cmd)
+
+            ScrcpyManager._adb_server_ready = True
+            logger.warning("No devices found in ADB device list")
+            return None, False
 
         except subprocess.TimeoutExpired:
             logger.error("ADB devices command timed out")
@@ -233,14 +433,14 @@ class ScrcpyManager:
         except Exception as DeviceSearchException:
             logger.error(f"Unexpected error during device detection: {DeviceSearchException}", exc_info=True)
 
-        return None
+        return None, True
 
     # Start Scrcpy Windows
     def start_scrcpy(self, serial=None, extra_top_args=None, extra_bottom_args=None):
         """
         Launch both scrcpy windows.
 
-        Launches the top screen first, waits for it to be initialized, then launches the bottom screen.
+        Launches the top and bottom screens in parallel, giving the top screen a short head start.
         Both windows are configured with:
         Borderless mode, optimized bitrates, 120FPS cap, openGL
 
@@ -255,9 +455,14 @@ class ScrcpyManager:
         Raises:
             RuntimeError: If device serial missing or scrcpy binary not found
         """
-        logger.info("=" * LOG_MULT)
+        logger.info(LOG_SEPARATOR)
         logger.info("Starting scrcpy instances")
-        logger.info("=" * LOG_MULT)
+        logger.info(LOG_SEPARATOR)
+
+        # Anything left over from a previous launch is stale, so clear it before relaunching
+        if self.processes:
+            logger.info("Stopping stale scrcpy instances before relaunch")
+            self.stop()
 
         if serial:
             self.serial = serial
@@ -274,28 +479,17 @@ class ScrcpyManager:
         logger.info(f"Device serial: {self.serial}")
         logger.info(f"Scrcpy binary: {self.scrcpy_bin}")
 
+        self._session_stamp = time.strftime("%Y%m%d_%H%M%S")
+
         # Base arguments for both windows
-        base = [
-            self.scrcpy_bin,
-            "-s",
-            self.serial,
-            "--window-borderless",
-            "--max-fps",
-            DEFAULT_MAX_FPS,
-            "--render-driver",
-            DEFAULT_RENDER_DRIVER,
-            "--mouse-bind=++++", # Enable all mouse bindings
-        ]
-
-        # Calculate bitrates based on resolution
-        bitrate_top = f"{max(TOP_BITRATE_MINIMUM, int(TOP_BITRATE_SCALE * 
-                                                      (self.scale**BITRATE_CALC_SCALE_FACTOR)))}M"
-        bitrate_bottom = f"{max(BOTTOM_BITRATE_MINIMUM, int(BOTTOM_BITRATE_SCALE * 
-                                                            (self.scale**BITRATE_CALC_SCALE_FACTOR)))}M"
-        logger.info(f"Video bitrates - Top: {bitrate_top}, Bottom: {bitrate_bottom}")
+        base = [self.scrcpy_bin, "-s", self.serial]
+        base.extend(SCRCPY_BASE_ARGS)
+
+        logger.info(f"Video bitrates - Top: {self._bitrate_top}, Bottom: {self._bitrate_bottom}")
 
         # Top window arguments
-        top_args = base + [
+        top_args = list(base)
+        top_args.extend((
             "--display-id",
             TOP_SCREEN_DISPLAY_ID,
             "--window-title",
@@ -303,22 +497,23 @@ class ScrcpyManager:
             "--window-width",
             str(self.f_w1),
             "--video-bit-rate",
-            bitrate_top,
-        ]
+            self._bitrate_top,
+        ))
 
         # Audio only on the top window to avoid conflicts
         if not self.enable_audio_top:
-            top_args += ["--no-audio"]
+            top_args.append("--no-audio")
             logger.debug("Audio disabled for top window")
         else:
             logger.debug("Audio enabled for top window")
 
         if extra_top_args:
-            top_args += extra_top_args
-            logger.debug(f"Extra top args: {extra_top_args}")
+            top_args.extend(extra_top_args)
+            logger.debug("Extra top args: %s", extra_top_args)
 
-        # Bottom window arguments (Always no audio)
-        bottom_args = base + [
+        # Bottom window arguments (Always no audio), reusing base directly as it is no longer needed
+        bottom_args = base
+        bottom_args.extend((
             "--display-id",
             BOTTOM_SCREEN_DISPLAY_ID,
             "--window-title",
@@ -326,40 +521,41 @@ class ScrcpyManager:
             "--window-width",
             str(self.f_w2),
             "--video-bit-rate",
-            bitrate_bottom,
+            self._bitrate_bottom,
             "--no-audio",
-        ]
+        ))
 
         if extra_bottom_args:
-            bottom_args += extra_bottom_args
-            logger.debug(f"Extra bottom args: {extra_bottom_args}")
+            bottom_args.extend(extra_bottom_args)
+            logger.debug("Extra bottom args: %s", extra_bottom_args)
 
-        # Start top screen first
+        # Start both screens concurrently, bottom slightly staggered behind top
         logger.info(f"Starting TOP window ({TOP_SCREEN_WINDOW_TITLE})")
-        logger.debug(f"Top window command: {' '.join(top_args)}")
-        p0 = self._start_with_retry(top_args, "top")
-
-        # Wait for top screen to initialise before starting bottom
-        logger.info(f"Waiting {self.scrcpy_start_delay}s before starting bottom window")
-        time.sleep(DISPLAY_INIT_DELAY)
-
-        # Start bottom screen
-        logger.info(f"Starting BOTTOM window ({BOTTOM_SCREEN_WINDOW_TITLE})")
-        logger.debug(f"Bottom window command: {' '.join(bottom_args)}")
-        p1 = self._start_with_retry(bottom_args, "bottom")
+        if logger.isEnabledFor(logging.DEBUG):
+            logger.debug("Top window command: %s", " ".join(top_args))
+        logger.info(f"Starting BOTTOM window ({BOTTOM_SCREEN_WINDOW_TITLE}) after {BOTTOM_LAUNCH_STAGGER}s")
+        if logger.isEnabledFor(logging.DEBUG):
+            logger.debug("Bottom window command: %s", " ".join(bottom_args))
+
+        with ThreadPoolExecutor(max_workers=2, thread_name_prefix="scrcpy-launch") as pool:
+            top_future = pool.submit(self._start_with_retry, top_args, "top")
+            bottom_future = pool.submit(self._start_with_retry, bottom_args, "bottom", BOTTOM_LAUNCH_STAGGER)
+            p0 = top_future.result()
+            p1 = bottom_future.result()
 
         logger.info("Both scrcpy instances started successfully")
-        logger.info("=" * LOG_MULT)
+        logger.info(LOG_SEPARATOR)
         return [p0, p1]
 
-    def _start_with_retry(self, cmd, label):
+    def _start_with_retry(self, cmd, label, delay=0):
         """
         Start a process and retry on failure.
-        Logs to ./logs/ if possible.
+        Logs to ./logs/ if possible. Safe to call from multiple threads.
 
         Args:
             cmd: Command list to execute
             label: Label for logging (e.g., "top" or "bottom")
+            delay: Seconds to wait before the first attempt
 
         Returns:
             Popen instance
@@ -370,43 +566,98 @@ class ScrcpyManager:
         logger.debug(
             f"Starting scrcpy {label} window with {self.scrcpy_retry_count} retry attempts"
         )
+
+        if delay:
+            time.sleep(delay)
+
+        # One log file per window per start, shared by all attempts
+        logfile = self._open_scrcpy_log(label)
+
+        try:
+            return self._start_attempts(cmd, label, logfile)
+        except Exception:
+            # On success the log stays open for the output pump and is closed in stop()
+            if logfile:
+                logfile.close()
+            raise
+
+    def _open_scrcpy_log(self, label):
+        """
+        Open the scrcpy output log for one window in binary append mode.
+
+        Args:
+            label: Label for logging (e.g., "top" or "bottom")
+
+        Returns:
+            File object, or None if the log could not be created
+        """
+        try:
+            log_path = os.path.join(self.logs_dir, f"scrcpy_{label}_{self._session_stamp}.log")
+            logfile = open(log_path, "ab")
+            logger.debug(f"Scrcpy {label} output logging to: {log_path}")
+            return logfile
+        except Exception as LogFileCreationError:
+            logger.warning(f"Failed to create scrcpy log file: {LogFileCreationError}")
+            return None
+
+    def _start_attempts(self, cmd, label, logfile):
+        """
+        Retry loop for _start_with_retry.
+
+        Output is piped to a background pump thread that writes it to the log,
+        so a slow disk never blocks scrcpy itself.
+
+        Args:
+            cmd: Command list to execute
+            label: Label for logging (e.g., "top" or "bottom")
+            logfile: Open binary log file, or None to discard output
+
+        Returns:
+            Popen instance
+
+        Raises:
+            Exception: If all retry attempts fail
+        """
         last_exc = None
+        stdout = subprocess.PIPE if logfile else subprocess.DEVNULL
+        stderr = subprocess.STDOUT if logfile else subprocess.DEVNULL
 
         for attempt in range(1, self.scrcpy_retry_count + 1):
+            pump = None
             try:
                 logger.debug(
                     f"Attempt {attempt}/{self.scrcpy_retry_count} for {label} window"
                 )
 
-                # Create log file for subprocess output
-                logfile = None
-                try:
-                    logs_dir = os.path.join(os.getcwd(), "logs")
-                    os.makedirs(logs_dir, exist_ok=True)
-                    stamp = time.strftime("%Y%m%d_%H%M%S")
-                    log_path = os.path.join(logs_dir, f"scrcpy_{label}_{stamp}.log")
-                    logfile = open(log_path, "w", encoding=LOGFILE_ENCODING)
-                    logger.debug(f"Scrcpy {label} output logging to: {log_path}")
-                except Exception as LogFileCreationError:
-                    logger.warning(f"Failed to create scrcpy log file: {LogFileCreationError}")
-                    logfile = None
-
-                # Redirect output to log file
-                stdout = logfile if logfile else subprocess.DEVNULL
-                stderr = logfile if logfile else subprocess.DEVNULL
+                if logfile and attempt > 1:
+                    logfile.write(f"\n--- retry {attempt} ---\n".encode(LOGFILE_ENCODING))
+                    logfile.flush()
 
                 # Start process
-                proc = subprocess.Popen(cmd, stdout=stdout, stderr=stderr, creationflags=CREATE_NO_WINDOW)
+                proc = subprocess.Popen(cmd, stdout=stdout, stderr=stderr, **SUBPROCESS_KWARGS)
+
+                if logfile:
+                    pump = threading.Thread(
+                        target=_pump_output, args=(proc.stdout, logfile),
+                        name=f"scrcpy-{label}-log", daemon=True,
+                    )
+                    pump.start()
 
-                # Verify process didn't instantly crash
-                time.sleep(SCRCPY_CREATION_DELAY)
-                if proc.poll() is not None:
+                # Verify process didn't instantly crash, waking as soon as it exits
+                try:
+                    exit_code = proc.wait(timeout=SCRCPY_CREATION_DELAY)
+                except subprocess.TimeoutExpired:
+                    exit_code = None
+                if exit_code is not None:
                     raise RuntimeError(
-                        f"Scrcpy {label} process died immediately (exit code: {proc.poll()})"
+                        f"Scrcpy {label} process died immediately (exit code: {exit_code})"
                     )
 
                 # Start process hidden
-                self.processes.append(proc)
+                with self._processes_lock:
+                    self.processes.append(proc)
+                    if pump:
+                        self._log_pumps.append((pump, logfile))
                 logger.info(
                     f"Scrcpy {label} window started successfully (PID: {proc.pid})"
                 )
@@ -414,14 +665,22 @@ class ScrcpyManager:
 
             except Exception as ScrcpyStartError:
                 last_exc = ScrcpyStartError
+                # Let the dead child's output finish landing in the log before retrying
+                if pump:
+                    pump.join(timeout=LOG_PUMP_JOIN_TIMEOUT)
                 logger.warning(f"Scrcpy {label} start attempt "
                                f"{attempt}/{self.scrcpy_retry_count} failed: {ScrcpyStartError}")
+                # A missing binary won't appear between attempts
+                if isinstance(ScrcpyStartError, FileNotFoundError):
+                    logger.error(f"Scrcpy binary could not be executed, not retrying {label} window")
+                    break
                 if attempt < self.scrcpy_retry_count:
-                    logger.debug(f"Waiting {SCRCPY_RETRY_DELAY}s before retry...")
-                    time.sleep(SCRCPY_RETRY_DELAY)
+                    retry_delay = min(SCRCPY_RETRY_BASE_DELAY * (2 ** (attempt - 1)), SCRCPY_RETRY_MAX_DELAY)
+                    logger.debug(f"Waiting {retry_delay}s before retry...")
+                    time.sleep(retry_delay)
 
         # All attempts failed
-        logger.error(f"All {self.scrcpy_retry_count} attempts to start scrcpy {label} window failed")
+        logger.error(f"Failed to start scrcpy {label} window after {attempt} attempt(s)")
         raise last_exc
 
     # Check if process is alive
@@ -430,11 +689,21 @@ class ScrcpyManager:
         Check if any processes that were tracked have died
 
         Returns the first process that is no longer alive or None if all are running.
+        On Windows all handles are tested with a single non-blocking wait.
 
         Returns:
             Popen object of dead process or None if all alive
         """
-        for processName, process in enumerate(self.processes):
+        exited = _find_exited_process(self.processes)
+        if exited is None:
+            return None
+        if exited is not False:
+            # Only the signalled process needs a poll(), which also collects its exit code
+            candidates = [(exited, self.processes[exited])]
+        else:
+            candidates = enumerate(self.processes)
+
+        for processName, process in candidates:
             try:
                 if process.poll() is not None:
                     logger.warning(f"Process {processName} "
@@ -445,6 +714,25 @@ class ScrcpyManager:
                 return process
         return None
 
+    def _remove_forwards(self, kind):
+        """
+        Remove all ADB forwards of one kind for the current device.
+
+        Args:
+            kind: "forward" or "reverse"
+        """
+        try:
+            logger.debug(f"Removing ADB {kind} forwards")
+            subprocess.run(
+                [self.adb_bin, "-s", self.serial, kind, "--remove-all"],
+                capture_output=ADB_CAPTURE_OUTPUT,
+                timeout=SCRCPY_TERMINATE_TIMEOUT,
+                **SUBPROCESS_KWARGS,
+            )
+            logger.debug(f"ADB {kind} forwards removed")
+        except Exception as ForwardsKillError:
+            logger.warning(f"Error removing ADB {kind} forwards: {ForwardsKillError}")
+
     # Stop Process
     def stop(self):
         """
@@ -452,25 +740,30 @@ class ScrcpyManager:
 
         Shuts down in the following order:
         1) Gracefully terminate (SIGTERM)
-        2) Wait for proceesses to exit
+        2) Wait for proceesses to exit (all at once via WaitForMultipleObjects on Windows)
         3) Force kill if needed (taskkill)
-        4) Device-side cleanup (kill scrcpy-server, app_process)
-        5) Remove ADB port forwards
+        4) Device-side cleanup (kill scrcpy-server, app_process in one adb shell call)
+        5) Remove ADB port forwards, skipped if step 4 found the device gone or timed out
 
         Safe to call multiple times
         """
-        logger.info("=" * LOG_MULT)
+        logger.info(LOG_SEPARATOR)
         logger.info("Stopping ScrcpyManager")
-        logger.info("=" * LOG_MULT)
+        logger.info(LOG_SEPARATOR)
 
         if not self.processes:
             logger.info("No scrcpy processes to stop")
             return
 
-        logger.info(f"Stopping {len(self.processes)} scrcpy process(es)")
+        # Detach the tracked list up front so launches can't mutate it while we iterate
+        with self._processes_lock:
+            processes = self.processes
+            self.processes = []
+
+        logger.info(f"Stopping {len(processes)} scrcpy process(es)")
 
         # Attempt graceful termination
-        for processName, process in enumerate(list(self.processes)):
+        for processName, process in enumerate(processes):
             try:
                 if process.poll() is None:
                     logger.debug(f"Terminating process {processName} (PID: {process.pid})")
@@ -482,10 +775,16 @@ class ScrcpyManager:
 
         # Wait for graceful exit, then force-kill remaining processes
         logger.debug("Waiting for processes to terminate gracefully...")
-        for processName, process in enumerate(list(self.processes)):
+        running = [process for process in processes if process.poll() is None]
+        all_exited = _wait_all_processes(running, PROCESS_TERMINATE_TIMEOUT) if running else True
+
+        # The combined wait already spent the timeout, so only fall back to per-process waits if unsupported
+        wait_timeout = PROCESS_TERMINATE_TIMEOUT if all_exited is None else 0
+
+        for processName, process in enumerate(processes):
             try:
                 if process.poll() is None:
-                    process.wait(timeout=PROCESS_TERMINATE_TIMEOUT)
+                    process.wait(timeout=wait_timeout)
                     logger.debug(f"Process {processName} (PID: {process.pid}) terminated gracefully")
             except subprocess.TimeoutExpired:
                 logger.warning(
@@ -502,6 +801,7 @@ class ScrcpyManager:
                             ["taskkill", "/F", "/T", "/PID", str(process.pid)],
                             capture_output=ADB_CAPTURE_OUTPUT,
                             timeout=ADB_TASKKILL_TIMEOUT,
+                            **SUBPROCESS_KWARGS,
                         )
                         logger.debug(f"Process {processName} killed with taskkill")
                     except Exception as TaskKillError:
@@ -509,88 +809,54 @@ class ScrcpyManager:
             except Exception as ProcessKillWaitingError:
                 logger.error(f"Error waiting for process {processName}: {ProcessKillWaitingError}")
 
-        # Clear process list
-        process_count = len(self.processes)
-        self.processes = []
-        logger.info(f"Cleared {process_count} process(es) from tracking list")
+        logger.info(f"Cleared {len(processes)} process(es) from tracking list")
+
+        # Let the output pumps flush the last lines, then close the log files
+        for pump, logfile in self._log_pumps:
+            pump.join(timeout=LOG_PUMP_JOIN_TIMEOUT)
+            logfile.close()
+        self._log_pumps = []
 
-        # Device-side cleanup (scrcpy server and app_process)
+        # Device-side cleanup (scrcpy server and app_process). The kill call doubles as the
+        # connection check: if it finds the device gone or times out, the forward removal is skipped
         if self.serial and self.adb_bin:
             logger.info(f"Performing device-side cleanup for {self.serial}")
+            device_present = True
 
-            # Kill scrcpy server
+            # Kill scrcpy server and app_process in a single shell round trip
             try:
-                logger.debug("Killing scrcpy-server on device")
+                logger.debug("Killing scrcpy-server and app_process on device")
                 result = subprocess.run(
                     [
                         self.adb_bin,
                         "-s",
                         self.serial,
                         "shell",
-                        "pkill",
-                        "-f",
-                        "scrcpy-server",
+                        DEVICE_CLEANUP_SHELL_SCRIPT,
                     ],
                     capture_output=ADB_CAPTURE_OUTPUT,
                     timeout=SCRCPY_TERMINATE_TIMEOUT,
+                    **SUBPROCESS_KWARGS,
                 )
+                stderr = result.stderr.decode(errors="replace").lower()
                 if result.returncode == 0:
-                    logger.debug("scrcpy-server killed successfully")
+                    logger.debug("scrcpy-server and app_process cleanup finished")
+                elif any(marker in stderr for marker in ADB_DEVICE_GONE_MARKERS):
+                    logger.info(f"Skipping remaining device cleanup: {self.serial} is not connected")
+                    device_present = False
                 else:
-                    logger.debug(f"pkill scrcpy-server returned {result.returncode} (may not have been running)")
+                    logger.debug(f"Device cleanup shell returned {result.returncode}")
             except subprocess.TimeoutExpired:
-                logger.warning("Timeout killing scrcpy-server")
+                logger.warning("Timeout killing scrcpy-server/app_process, skipping remaining device cleanup")
+                device_present = False
             except Exception as ScrcpyKillError:
-                logger.warning(f"Error killing scrcpy-server: {ScrcpyKillError}")
+                logger.warning(f"Error killing scrcpy-server/app_process: {ScrcpyKillError}")
 
-            # Kill app_process
-            try:
-                logger.debug("Killing app_process on device")
-                result = subprocess.run(
-                    [
-                        self.adb_bin,
-                        "-s",
-                        self.serial,
-                        "shell",
-                        "pkill",
-                        "-f",
-                        "app_process",
-                    ],
-                    capture_output=ADB_CAPTURE_OUTPUT,
-                    timeout=SCRCPY_TERMINATE_TIMEOUT,
-                )
-                if result.returncode == 0:
-                    logger.debug("app_process killed successfully")
-                else:
-                    logger.debug(f"pkill app_process returned {result.returncode} (may not have been running)")
-            except subprocess.TimeoutExpired:
-                logger.warning("Timeout killing app_process")
-            except Exception as AppProcessKillError:
-                logger.warning(f"Error killing app_process: {AppProcessKillError}")
-
-            # Remove port forwards
-            try:
-                logger.debug("Removing ADB port forwards")
-                subprocess.run(
-                    [self.adb_bin, "-s", self.serial, "forward", "--remove-all"],
-                    capture_output=ADB_CAPTURE_OUTPUT,
-                    timeout=SCRCPY_TERMINATE_TIMEOUT,
-                )
-                logger.debug("Port forwards removed")
-            except Exception as PortForwardsKillError:
-                logger.warning(f"Error removing port forwards: {PortForwardsKillError}")
-
-            # Remove all reverse forwards
-            try:
-                logger.debug("Removing ADB reverse forwards")
-                subprocess.run(
-                    [self.adb_bin, "-s", self.serial, "reverse", "--remove-all"],
-                    capture_output=ADB_CAPTURE_OUTPUT,
-                    timeout=SCRCPY_TERMINATE_TIMEOUT,
-                )
-                logger.debug("Reverse forwards removed")
-            except Exception as ReverseForwardsKillError:
-                logger.warning(f"Error removing reverse forwards: {ReverseForwardsKillError}")
+            if device_present:
+                # Remove port and reverse forwards concurrently (both are host-side adb calls)
+                with ThreadPoolExecutor(max_workers=2, thread_name_prefix="adb-cleanup") as pool:
+                    pool.submit(self._remove_forwards, "forward")
+                    pool.submit(self._remove_forwards, "reverse")
 
             logger.info("Device-side cleanup complete")
         else:
@@ -600,4 +866,4 @@ class ScrcpyManager:
                 logger.debug("Skipping device cleanup: no ADB binary")
 
         logger.info("ScrcpyManager stopped successfully")
-        logger.info("=" * LOG_MULT)
+        logger.info(LOG_SEPARATOR)
@@ -18,25 +18,35 @@
 # src/ui_pygame.py
 
 import pygame
+import pygame.freetype
 import os
-import tkinter as tk
 import time
 import logging
-from ctypes import windll, byref, wintypes
+import threading
+from functools import partial, lru_cache
+from operator import attrgetter
+from ctypes import windll, byref, wintypes, c_int, c_void_p, c_size_t, sizeof, memmove, POINTER, Structure
 import sys
 from src.win32_darkmode import enable_dark_titlebar
+from src.presets import MAX_PRESET_NAME_LENGTH
+
+# NOTE: this module is bound by SDL/GDI calls, not by Python arithmetic. Numba @njit would add
+# per-call dispatch overhead and cannot speed up pygame/ctypes/Win32 calls, so none is used here.
+# Batch work (e.g. hover tests) should go through pygame's C helpers such as Rect.collidelist().
 
 # Setup logger for this module
 logger = logging.getLogger(__name__)
 
 # Colour Conversion Fallback
 DEFAULT_HEX_COLOUR = (255,255,255)
+HEX_COLOUR_CACHE_SIZE = 64  # Distinct colours remembered by hex_to_rgb()
 
 # Loading screen configuration
 LOADING_SCREEN_WIDTH = 400
 LOADING_SCREEN_HEIGHT = 200
 LOADING_SCREEN_FONT_SIZE = 36
-LOADING_ANIMATION_FRAME_COUNT = 120
+LOADING_SCREEN_DURATION_MS = 2000
+LOADING_SCREEN_PUMP_MS = 50  # Event pump interval while the loading screen is held
 LOADING_SCREEN_COLOR = (18, 20, 24)
 LOADING_SCREEN_X = 60
 LOADING_SCREEN_Y = 80
@@ -45,32 +55,39 @@ LOADING_SCREEN_Y = 80
 CONTROL_PANEL_OFFSET_X = 460
 CONTROL_PANEL_WIDTH = 450
 CONTROL_PANEL_HEIGHT = 900
+CONTROL_PANEL_Y = 50
 
 # Font sizes
 LARGE_FONT_SIZE = 24
 MEDIUM_FONT_SIZE = 16
 SMALL_FONT_SIZE = 14
 
-# Colour palette hex values
-BG_HEX = "#121418"
-PANEL_HEX = "#1e2128"
-BORDER_HEX = "#2d3139"
-TEXT_HEX = "#c8cdd8"
-ACCENT_HEX = "#4a90e2"
-TOP_HEX = "#e74c3c"
-BOTTOM_HEX = "#3498db"
-SUCCESS_HEX = "#2ecc71"
-DANGER_HEX = "#e74c3c"
-WARNING_HEX = "#f39c12"
+# Colour palette hex values (ints, so hex_to_rgb only has to shift the channels out)
+BG_HEX = 0x121418
+PANEL_HEX = 0x1e2128
+BORDER_HEX = 0x2d3139
+TEXT_HEX = 0xc8cdd8
+ACCENT_HEX = 0x4a90e2
+TOP_HEX = 0xe74c3c
+BOTTOM_HEX = 0x3498db
+SUCCESS_HEX = 0x2ecc71
+DANGER_HEX = 0xe74c3c
+WARNING_HEX = 0xf39c12
 
 # Status message config
-INITIAL_STATUS_MESSAGE_TIME = 0
+INITIAL_STATUS_MESSAGE_TIME = 0  # time.monotonic() baseline, so no message is shown at startup
 STATUS_MESSAGE_DURATION = 2.0
 DEFAULT_STATUS_MESSAGE_TYPE = "info"
 
+# Text surface cache size (oldest entries evicted first)
+TEXT_CACHE_MAX_ENTRIES = 256
+
 # Preset config
 DEFAULT_PRESET_NAME = "NewPreset"
-PRESET_CACHE_TIME = 0.5
+
+# Longest value typed into a slider input box
+SLIDER_INPUT_MAX_LENGTH = 8
+SLIDER_INPUT_DIGITS = frozenset("0123456789")  # ASCII only; str.isdigit() also accepts e.g. "²"
 
 # Slider dimensions and positioning
 SLIDER_LABEL_X = 40
@@ -85,7 +102,6 @@ SLIDER_TRACK_RECT_WIDTH = 370
 SLIDER_TRACK_RECT_HEIGHT = 4
 SLIDER_TRACK_BORDER_RADIUS = 2
 
-SLIDER_HANDLE_FALLBACK_VALUE = 0.5
 SLIDER_HANDLE_OFFSET_X = 8
 SLIDER_HANDLE_OFFSET_Y = 6
 SLIDER_HANDLE_WIDTH = 16
@@ -163,10 +179,13 @@ PRESET_BORDER_RADIUS = 5
 # Win32 SetWindowPos flags
 SWP_NOZORDER = 0x0004
 SWP_NOACTIVATE = 0x0010
-SWP_FRAMECHANGED = 0x0020
-SWP_NOMOVE = 0x0002
 SWP_NOSIZE = 0x0001
 
+# Win32 RedrawWindow flags
+RDW_INVALIDATE = 0x0001
+RDW_UPDATENOW = 0x0100
+RDW_FRAME = 0x0400  # Include the non-client frame in the repaint
+
 # Text colors for buttons
 WHITE_TEXT = (255, 255, 255)
 BLACK_TEXT = (0, 0, 0)
@@ -190,14 +209,101 @@ BUTTON_BORDER_RADIUS = 4
 
 PRESET_ROW_SPACING = 45
 
+# Height of the status line region pushed to the display
+STATUS_TEXT_HEIGHT = 20
+
 # Error message durations
 ERROR_STATUS_DURATION = 3.0
 SLIDER_ERROR_STATUS_DURATION = 1.5
 
+# Posted once a status message has expired so the idle UI wakes up to clear it
+STATUS_EXPIRE_EVENT = pygame.USEREVENT + 1
+# Posted by the preset loader thread when a fresh preset list is ready
+PRESETS_LOADED_EVENT = pygame.USEREVENT + 2
+
 # Windows clipboard and GDI constants
-CF_BITMAP = 2  # Clipboard format for bitmap images
+CF_DIB = 8  # Clipboard format for a packed device-independent bitmap
+DIB_RGB_COLORS = 0
+BI_RGB = 0  # Uncompressed DIB pixels
+SCREENSHOT_BIT_COUNT = 32  # BGRX pixels, no colour table
+GMEM_MOVEABLE = 0x0002  # Clipboard data must be a moveable global allocation
 SRCCOPY = 0x00CC0020  # BitBlt copy mode (straight pixel copy)
+PW_CLIENTONLY = 0x00000001  # PrintWindow flag to capture only the client area
+PW_RENDERFULLCONTENT = 0x00000002  # PrintWindow flag to capture DWM-composited content
 SW_SHOW = 5
+SM_CXSCREEN = 0  # GetSystemMetrics index for the primary screen width
+
+# RedrawWindow flags to repaint a window and its frame immediately
+RDW_FRAME_REFRESH = RDW_INVALIDATE | RDW_UPDATENOW | RDW_FRAME
+
+# Win32 libraries and prototypes, resolved once at import
+user32 = windll.user32
+gdi32 = windll.gdi32
+user32.SetWindowPos.argtypes = [wintypes.HWND, wintypes.HWND, c_int, c_int, c_int, c_int, wintypes.UINT]
+user32.SetWindowPos.restype = wintypes.BOOL
+user32.ShowWindow.argtypes = [wintypes.HWND, c_int]
+user32.ShowWindow.restype = wintypes.BOOL
+user32.RedrawWindow.argtypes = [wintypes.HWND, c_void_p, wintypes.HRGN, wintypes.UINT]
+user32.RedrawWindow.restype = wintypes.BOOL
+user32.SetClipboardData.argtypes = [wintypes.UINT, wintypes.HANDLE]
+user32.SetClipboardData.restype = wintypes.HANDLE
+user32.OpenClipboard.argtypes = [wintypes.HWND]
+user32.OpenClipboard.restype = wintypes.BOOL
+user32.EmptyClipboard.argtypes = []
+user32.EmptyClipboard.restype = wintypes.BOOL
+user32.CloseClipboard.argtypes = []
+user32.CloseClipboard.restype = wintypes.BOOL
+user32.GetClientRect.argtypes = [wintypes.HWND, POINTER(wintypes.RECT)]
+user32.GetClientRect.restype = wintypes.BOOL
+user32.GetDC.argtypes = [wintypes.HWND]
+user32.GetDC.restype = wintypes.HDC
+user32.ReleaseDC.argtypes = [wintypes.HWND, wintypes.HDC]
+user32.ReleaseDC.restype = c_int
+user32.PrintWindow.argtypes = [wintypes.HWND, wintypes.HDC, wintypes.UINT]
+user32.PrintWindow.restype = wintypes.BOOL
+user32.GetSystemMetrics.argtypes = [c_int]
+user32.GetSystemMetrics.restype = c_int
+gdi32.CreateDIBSection.argtypes = [wintypes.HDC, c_void_p, wintypes.UINT, POINTER(c_void_p), wintypes.HANDLE,
+                                   wintypes.DWORD]
+gdi32.CreateDIBSection.restype = wintypes.HBITMAP
+gdi32.CreateCompatibleDC.argtypes = [wintypes.HDC]
+gdi32.CreateCompatibleDC.restype = wintypes.HDC
+gdi32.SelectObject.argtypes = [wintypes.HDC, wintypes.HGDIOBJ]
+gdi32.SelectObject.restype = wintypes.HGDIOBJ
+gdi32.BitBlt.argtypes = [wintypes.HDC, c_int, c_int, c_int, c_int, wintypes.HDC, c_int, c_int, wintypes.DWORD]
+gdi32.BitBlt.restype = wintypes.BOOL
+gdi32.DeleteObject.argtypes = [wintypes.HGDIOBJ]
+gdi32.DeleteObject.restype = wintypes.BOOL
+gdi32.DeleteDC.argtypes = [wintypes.HDC]
+gdi32.DeleteDC.restype = wintypes.BOOL
+gdi32.GdiFlush.argtypes = []
+gdi32.GdiFlush.restype = wintypes.BOOL
+kernel32 = windll.kernel32
+kernel32.GlobalAlloc.argtypes = [wintypes.UINT, c_size_t]
+kernel32.GlobalAlloc.restype = wintypes.HGLOBAL
+kernel32.GlobalLock.argtypes = [wintypes.HGLOBAL]
+kernel32.GlobalLock.restype = c_void_p
+kernel32.GlobalUnlock.argtypes = [wintypes.HGLOBAL]
+kernel32.GlobalUnlock.restype = wintypes.BOOL
+kernel32.GlobalFree.argtypes = [wintypes.HGLOBAL]
+kernel32.GlobalFree.restype = wintypes.HGLOBAL
+
+
+class BITMAPINFOHEADER(Structure):
+    """Win32 BITMAPINFOHEADER, used both to create the screenshot DIB and as the CF_DIB header"""
+    _fields_ = [
+        ("biSize", wintypes.DWORD),
+        ("biWidth", wintypes.LONG),
+        ("biHeight", wintypes.LONG),
+        ("biPlanes", wintypes.WORD),
+        ("biBitCount", wintypes.WORD),
+        ("biCompression", wintypes.DWORD),
+        ("biSizeImage", wintypes.DWORD),
+        ("biXPelsPerMeter", wintypes.LONG),
+        ("biYPelsPerMeter", wintypes.LONG),
+        ("biClrUsed", wintypes.DWORD),
+        ("biClrImportant", wintypes.DWORD),
+    ]
 
 
 def resource_path(rel):
@@ -230,6 +336,7 @@ FONT_PATH = resource_path("assets/fonts/CalSans-Regular.ttf")
 ICON_PATH = resource_path("assets/icon.png")
 
 
+@lru_cache(maxsize=HEX_COLOUR_CACHE_SIZE)
 def hex_to_rgb(hex_color):
     """
     Convert hex color to RGB tuple
@@ -243,18 +350,80 @@ def hex_to_rgb(hex_color):
     Returns:
         tuple: (r, g, b)
     """
-    try:
-        if isinstance(hex_color, int):
-            hex_color = f"{hex_color:06x}"
+    # Ints are already packed, so the channels are just shifted out
+    if isinstance(hex_color, int):
+        return (hex_color >> 16) & 0xFF, (hex_color >> 8) & 0xFF, hex_color & 0xFF
 
-        if isinstance(hex_color, str):
-            hex_color = hex_color.lstrip("#")
-
-        rgb = tuple(int(hex_color[i : i + 2], 16) for i in (0, 2, 4))
-        return rgb
-    except Exception as HexConversionError:
+    # int() with base 16 accepts an optional "0x" prefix itself
+    try:
+        hex_color = int(hex_color.lstrip("#"), 16)
+    except ValueError as HexConversionError:
         logger.error(f"Failed to convert hex color '{hex_color}': {HexConversionError}")
         return DEFAULT_HEX_COLOUR
+    return (hex_color >> 16) & 0xFF, (hex_color >> 8) & 0xFF, hex_color & 0xFF
+
+
+# UI palette as RGB tuples, converted once at import
+COLORS = {
+    "bg": hex_to_rgb(BG_HEX),
+    "panel": hex_to_rgb(PANEL_HEX),
+    "border": hex_to_rgb(BORDER_HEX),
+    "text": hex_to_rgb(TEXT_HEX),
+    "accent": hex_to_rgb(ACCENT_HEX),
+    "top": hex_to_rgb(TOP_HEX),
+    "bot": hex_to_rgb(BOTTOM_HEX),
+    "success": hex_to_rgb(SUCCESS_HEX),
+    "danger": hex_to_rgb(DANGER_HEX),
+    "warning": hex_to_rgb(WARNING_HEX),
+}
+
+# Loaded fonts keyed by point size, shared by the loading screen and the UI
+_FONT_CACHE = {}
+
+
+def _get_font(size):
+    """
+    Get the UI font at the given size, loading it on first use
+
+    Falls back to Arial if the bundled font can't be loaded
+
+    Args:
+        size: Point size
+
+    Returns:
+        pygame.freetype.Font
+    """
+    font = _FONT_CACHE.get(size)
+    if font is None:
+        try:
+            font = pygame.freetype.Font(FONT_PATH, size)
+        except Exception as FontLoadError:
+            logger.warning(f"Failed to load custom font at size {size}, using default: {FontLoadError}")
+            font = pygame.freetype.SysFont("Arial", size)
+        # Pad rendered text to the full line height so layout matches pygame.font
+        font.pad = True
+        _FONT_CACHE[size] = font
+    return font
+
+
+# Window icon, decoded once and shared by the loading screen and the UI window
+_ICON_SURFACE = None
+
+
+def _get_icon():
+    """
+    Get the window icon surface, loading it from disk on first use
+
+    Returns:
+        pygame.Surface
+
+    Raises:
+        pygame.error: If the icon file can't be loaded; failures aren't cached, so a later call retries
+    """
+    global _ICON_SURFACE
+    if _ICON_SURFACE is None:
+        _ICON_SURFACE = pygame.image.load(ICON_PATH)
+    return _ICON_SURFACE
 
 
 # Loading Screen Manager
@@ -265,22 +434,22 @@ def show_loading_screen():
     logger.info("Initializing loading screen")
 
     try:
-        pygame.init()
+        if not pygame.get_init():
+            pygame.init()
     except Exception as PygameInitError:
         logger.error(f"Failed to initialize pygame for loading screen: {PygameInitError}")
         return
 
     # Set window icon
     try:
-        icon_surface = pygame.image.load(ICON_PATH)
-        pygame.display.set_icon(icon_surface)
+        pygame.display.set_icon(_get_icon())
         logger.debug("Loading screen icon set successfully")
     except Exception as LoadingScreenInitError:
         logger.warning(f"Failed to load icon for loading screen: {LoadingScreenInitError}")
 
     # Initialize window
     try:
-        screen = pygame.display.set_mode((LOADING_SCREEN_WIDTH, LOADING_SCREEN_HEIGHT))
+        screen = pygame.display.set_mode((LOADING_SCREEN_WIDTH, LOADING_SCREEN_HEIGHT), pygame.SWSURFACE, vsync=0)
         pygame.display.set_caption("ThorCPY Loading...")
         logger.debug("Loading screen window created")
     except Exception as LoadingScreenCreationError:
@@ -298,30 +467,30 @@ def show_loading_screen():
         logger.warning(f"Failed to enable dark titlebar for loading screen: {DarkTitlebarEnableError}")
 
     # Setup font
-    try:
-        font = pygame.font.Font(FONT_PATH, LOADING_SCREEN_FONT_SIZE)
-        logger.debug("Loading screen font loaded")
-    except Exception as LoadingFontError:
-        logger.warning(f"Failed to load custom font, using default: {LoadingFontError}")
-        font = pygame.font.SysFont("Arial", LOADING_SCREEN_FONT_SIZE)
-
-    # Animation loop
-    clock = pygame.time.Clock()
-    logger.debug(f"Starting loading screen animation ({LOADING_ANIMATION_FRAME_COUNT} frames)")
-    for frame in range(LOADING_ANIMATION_FRAME_COUNT):
-        try:
-            screen.fill(LOADING_SCREEN_COLOR)
-            txt = font.render("Starting ThorCPY...", True, (200, 200, 200))
-            screen.blit(txt, (LOADING_SCREEN_X, LOADING_SCREEN_Y))
-            pygame.display.flip()
-            clock.tick(LOADING_ANIMATION_FRAME_COUNT/2)
-        except Exception as LoadingScreenRenderError:
-            logger.error(f"Error during loading screen render at frame {frame}: {LoadingScreenRenderError}")
-            break
+    font = _get_font(LOADING_SCREEN_FONT_SIZE)
 
-    # Cleanup
+    # The screen is static, so draw it once and hold it
+    logger.debug(f"Showing loading screen for {LOADING_SCREEN_DURATION_MS} ms")
     try:
-        pygame.display.quit()
+        screen.fill(LOADING_SCREEN_COLOR)
+        txt = font.render("Starting ThorCPY...", (200, 200, 200))[0]
+        screen.blit(txt, (LOADING_SCREEN_X, LOADING_SCREEN_Y))
+        pygame.display.flip()
+
+        # Keep pumping events while holding so Windows doesn't flag the window as not responding
+        # The last wait is clipped to the deadline so the hold doesn't overrun by up to a pump interval
+        end = time.monotonic() + LOADING_SCREEN_DURATION_MS / 1000
+        remaining_ms = LOADING_SCREEN_DURATION_MS
+        while remaining_ms > 0:
+            pygame.event.pump()
+            pygame.time.wait(min(LOADING_SCREEN_PUMP_MS, remaining_ms))
+            remaining_ms = int((end - time.monotonic()) * 1000)
+    except Exception as LoadingScreenRenderError:
+        logger.error(f"Error during loading screen render: {LoadingScreenRenderError}")
+
+    # Hide rather than quit the display so the UI window reuses the SDL video subsystem
+    try:
+        pygame.display.set_mode((1, 1), pygame.HIDDEN)
         logger.info("Loading screen closed")
     except Exception as LoadingScreenCloseError:
         logger.warning(f"Error closing loading screen: {LoadingScreenCloseError}")
@@ -347,7 +516,8 @@ class PygameUI:
         self.l = launcher
 
         try:
-            pygame.init()
+            if not pygame.get_init():
+                pygame.init()
             logger.debug("Pygame initialized for UI")
         except Exception as PygameInitError:
             logger.error(f"Failed to initialize pygame: {PygameInitError}")
@@ -355,32 +525,37 @@ class PygameUI:
 
         # Set window icon
         try:
-            icon_surface = pygame.image.load(ICON_PATH)
-            pygame.display.set_icon(icon_surface)
+            pygame.display.set_icon(_get_icon())
             logger.debug("UI window icon set successfully")
         except Exception as IconLoadError:
             logger.warning(f"Failed to load UI icon: {IconLoadError}")
 
         # Position the UI on the far right of the screen
+        x_pos = None
         try:
-            root = tk.Tk()
-            sw = root.winfo_screenwidth()
-            root.destroy()
+            sw = user32.GetSystemMetrics(SM_CXSCREEN)
             x_pos = sw - CONTROL_PANEL_OFFSET_X
-            os.environ["SDL_VIDEO_WINDOW_POS"] = f"{x_pos},50"
-            logger.debug(f"UI window position set to ({x_pos}, 50)")
+            os.environ["SDL_VIDEO_WINDOW_POS"] = f"{x_pos},{CONTROL_PANEL_Y}"
+            logger.debug(f"UI window position set to ({x_pos}, {CONTROL_PANEL_Y})")
         except Exception as ControlWindowPositionError:
             logger.warning(f"Failed to position UI window: {ControlWindowPositionError}")
 
         # Create window
         try:
-            self.screen = pygame.display.set_mode((CONTROL_PANEL_WIDTH, CONTROL_PANEL_HEIGHT))
+            self.screen = pygame.display.set_mode(
+                (CONTROL_PANEL_WIDTH, CONTROL_PANEL_HEIGHT), pygame.SWSURFACE, vsync=0
+            )
             pygame.display.set_caption("ThorCPY Control Panel")
             logger.debug("UI window created successfully")
         except Exception as UICreationError:
             logger.error(f"Failed to create UI window: {UICreationError}")
             raise
 
+        # Batch blitter for each frame's widgets: pygame-ce's fblits() skips the per-item area and
+        # flag parsing of blits(); plain pygame falls back to blits() without the result list
+        self._blit_batch = getattr(self.screen, "fblits", None) or partial(self.screen.blits, doreturn=False)
+        self._frame_blits = []  # (surface, position) pairs collected during render(), in draw order
+
         # Enable the dark titlebar for the window
         try:
             info = pygame.display.get_wm_info()
@@ -388,33 +563,47 @@ class PygameUI:
             if hwnd:
                 enable_dark_titlebar(hwnd)
                 logger.debug("UI window dark titlebar enabled")
+
+                # The splash window is reused, so SDL_VIDEO_WINDOW_POS may not be reapplied
+                if x_pos is not None:
+                    user32.SetWindowPos(hwnd, 0, x_pos, CONTROL_PANEL_Y, 0, 0,
+                                               SWP_NOZORDER | SWP_NOACTIVATE | SWP_NOSIZE)
         except Exception as DarkTitlebarError:
             logger.warning(f"Failed to enable dark titlebar for UI window: {DarkTitlebarError}")
 
-        # Load font
-        try:
-            self.font_lg = pygame.font.Font(FONT_PATH, LARGE_FONT_SIZE)
-            self.font_md = pygame.font.Font(FONT_PATH, MEDIUM_FONT_SIZE)
-            self.font_sm = pygame.font.Font(FONT_PATH, SMALL_FONT_SIZE)
-            logger.debug("UI fonts loaded successfully")
-        except Exception as UIFontLoadError:
-            logger.warning(f"Failed to load custom fonts, using default: {UIFontLoadError}")
-            self.font_lg = pygame.font.SysFont("Arial", LARGE_FONT_SIZE)
-            self.font_md = pygame.font.SysFont("Arial", MEDIUM_FONT_SIZE)
-            self.font_sm = pygame.font.SysFont("Arial", SMALL_FONT_SIZE)
+        # Mouse motion is read by polling once per loop iteration in poll_mouse(), so drop the per-pixel
+        # MOUSEMOTION event storm instead of waking the loop and dispatching each one. With no events,
+        # hovering is picked up through is_interactive(), which keeps the loop at frame rate while
+        # the pointer moves
+        pygame.event.set_blocked(pygame.MOUSEMOTION)
+
+        # Load fonts (freetype keeps its own glyph cache across renders)
+        self.font_lg = _get_font(LARGE_FONT_SIZE)
+        self.font_md = _get_font(MEDIUM_FONT_SIZE)
+        self.font_sm = _get_font(SMALL_FONT_SIZE)
+        logger.debug("UI fonts loaded")
 
         # Colors
-        self.colors = {
-            "bg": hex_to_rgb(BG_HEX),
-            "panel": hex_to_rgb(PANEL_HEX),
-            "border": hex_to_rgb(BORDER_HEX),
-            "text": hex_to_rgb(TEXT_HEX),
-            "accent": hex_to_rgb(ACCENT_HEX),
-            "top": hex_to_rgb(TOP_HEX),
-            "bot": hex_to_rgb(BOTTOM_HEX),
-            "success": hex_to_rgb(SUCCESS_HEX),
-            "danger": hex_to_rgb(DANGER_HEX),
-            "warning": hex_to_rgb(WARNING_HEX),
+        self.colors = COLORS
+
+        # Direct attributes for the hot render path (self.colors kept for lookups by name)
+        self.c_bg = self.colors["bg"]
+        self.c_panel = self.colors["panel"]
+        self.c_border = self.colors["border"]
+        self.c_text = self.colors["text"]
+        self.c_accent = self.colors["accent"]
+        self.c_top = self.colors["top"]
+        self.c_bot = self.colors["bot"]
+        self.c_success = self.colors["success"]
+        self.c_danger = self.colors["danger"]
+        self.c_warning = self.colors["warning"]
+
+        # Status message type -> text colour
+        self._status_color_map = {
+            "success": self.c_success,
+            "error": self.c_danger,
+            "warning": self.c_warning,
+            "info": self.c_text,
         }
 
         # Slider interaction
@@ -436,37 +625,346 @@ class PygameUI:
         self.active_slider_input = None
         self.input_buffer = ""
 
-        # Cached presets
-        self._preset_cache = None
-        self._preset_cache_time = 0
+        # Rendered text surfaces keyed by (font id, text, colour)
+        self._text_cache = {}
+
+        # Pre-rendered static chrome, built on first render
+        self._bg_surface = None
+        self._row_template = None
+        self._preset_row_cache = {}  # preset name -> row surface with the name drawn in
+        self._preset_row_blits = None  # (row surface, position) per preset, rebuilt on reload
+        self._preset_names = []  # Preset names in row order, so a clicked row maps straight to its name
+        self._val_str_cache = {}  # slider attr -> (value, rendered value text, blit position)
+        self._rrect_cache = {}  # (size, colour, radius, width) -> pre-drawn rounded rect surface
+
+        # Fixed widget geometry, built once and reused every frame
+        self._slider_geom = {
+            attr: (
+                pygame.Rect(SLIDER_RECT_LEFT, y, SLIDER_RECT_WIDTH, SLIDER_RECT_HEIGHT),
+                pygame.Rect(SLIDER_TRACK_RECT_LEFT, y + SLIDER_TRACK_OFFSET_Y, SLIDER_TRACK_RECT_WIDTH,
+                            SLIDER_TRACK_RECT_HEIGHT),
+            )
+            for attr, y in (
+                ("global_scale", SLIDER_SCALE_Y),
+                ("tx", SLIDER_TOP_X_Y),
+                ("ty", SLIDER_TOP_Y_Y),
+                ("bx", SLIDER_BOTTOM_X_Y),
+                ("by", SLIDER_BOTTOM_Y_Y),
+            )
+        }
+        # Value ranges as (minimum, span, track pixels per unit); the bounds are constants,
+        # so the per-frame handle position needs no division or zero-span check
+        self._slider_ranges = {
+            attr: (min_val, max_val - min_val, SLIDER_TRACK_RECT_WIDTH / (max_val - min_val))
+            for attr, min_val, max_val in (
+                ("global_scale", GLOBAL_SCALE_MIN, GLOBAL_SCALE_MAX),
+                ("tx", SCREEN_MIN_POS, SCREEN_MAX_POS),
+                ("ty", SCREEN_MIN_POS, SCREEN_MAX_POS),
+                ("bx", SCREEN_MIN_POS, SCREEN_MAX_POS),
+                ("by", SCREEN_MIN_POS, SCREEN_MAX_POS),
+            )
+        }
+        # One handle rect per slider; only its x moves, so draw_slider() updates it in place
+        self._slider_handles = {
+            attr: pygame.Rect(0, track.top - SLIDER_HANDLE_OFFSET_Y, SLIDER_HANDLE_WIDTH, SLIDER_HANDLE_HEIGHT)
+            for attr, (_, track) in self._slider_geom.items()
+        }
+        self._undock_btn = pygame.Rect(UNDOCK_BUTTON_X, UNDOCK_BUTTON_Y, UNDOCK_BUTTON_WIDTH, UNDOCK_BUTTON_HEIGHT)
+        self._shot_btn = pygame.Rect(SCREENSHOT_BUTTON_X, SCREENSHOT_BUTTON_Y, SCREENSHOT_BUTTON_WIDTH,
+                                     SCREENSHOT_BUTTON_HEIGHT)
+        self._input_rect = pygame.Rect(PRESET_INPUT_X, PRESET_Y, PRESET_INPUT_WIDTH, PRESET_HEIGHT)
+        self._save_btn = pygame.Rect(PRESET_SAVE_BUTTON_X, PRESET_Y, PRESET_SAVE_BUTTON_WIDTH, PRESET_HEIGHT)
+
+        # Slider value setters, resolved once. Plain instance attributes are written straight into
+        # the launcher's __dict__; anything else (properties, slots) falls back to setattr
+        launcher_attrs = getattr(self.l, "__dict__", {})
+        self._slider_setters = {
+            attr: (
+                partial(launcher_attrs.__setitem__, attr)
+                if attr in launcher_attrs and not hasattr(type(self.l), attr)
+                else partial(setattr, self.l, attr)
+            )
+            for attr in self._slider_geom
+        }
+
+        # Position sliders in draw order with their accent colour; their values are read
+        # from the launcher in one attrgetter call per frame
+        self._position_sliders = (("tx", self.c_top), ("ty", self.c_top), ("bx", self.c_bot), ("by", self.c_bot))
+        self._position_values = attrgetter(*(attr for attr, _ in self._position_sliders))
+
+        # Fixed hover targets, hit-tested against the mouse in a single collidelist() call
+        self._hit_rects = [val_box for val_box, _ in self._slider_geom.values()] + [
+            self._undock_btn, self._shot_btn, self._input_rect, self._save_btn
+        ]
+        self._mouse_rect = pygame.Rect(0, 0, 1, 1)
+
+        # Screen regions whose contents can change between frames; only these are pushed to the
+        # display. Each slider's track band spans the full handle travel so the old handle is erased,
+        # and is merged with the value box right above it into one rect per slider row
+        self._update_rects = [
+            val_box.union(
+                pygame.Rect(SLIDER_TRACK_RECT_LEFT - SLIDER_HANDLE_OFFSET_X, track.top - SLIDER_HANDLE_OFFSET_Y,
+                            SLIDER_TRACK_RECT_WIDTH + SLIDER_HANDLE_WIDTH, SLIDER_HANDLE_HEIGHT)
+            )
+            for val_box, track in self._slider_geom.values()
+        ]
+        self._update_rects += [
+            pygame.Rect(RESTART_NOTIF_X, RESTART_NOTIF_Y, SLIDER_TRACK_RECT_WIDTH, SLIDER_TOP_X_Y - RESTART_NOTIF_Y),
+            self._undock_btn,
+            self._shot_btn,
+            pygame.Rect(STATUS_TEXT_X, STATUS_TEXT_Y, CONTROL_PANEL_WIDTH - STATUS_TEXT_X, STATUS_TEXT_HEIGHT),
+            self._input_rect,
+        ]
+        # The preset list is made of static row surfaces, so it is only pushed (as part of a full
+        # flip) on the frame its rows are rebuilt
+        self._full_flip = True  # First frame and window exposes push the whole surface
+        self._visible = True  # False while the panel is minimized or hidden; render() then does nothing
+        # What each _update_rects region showed when it was last pushed; regions whose
+        # state is unchanged are left out of the next display update
+        self._region_states = [None] * len(self._update_rects)
+
+        # Redraw tracking: frames are only drawn when something has changed
+        self._dirty = True
+
+        # Set when a layout change needs force_window_sync(); coalesced to one call per frame
+        self._pending_sync = False
+        # Handles, positions and sizes applied by the last force sync (reset when they change elsewhere)
+        self._last_sync_key = None
+        self._last_frame_state = None  # Mouse and layout state the last drawn frame was built from
+
+        # Screenshot capture target (mem DC, DIB section, ...), reused while the container size holds
+        self._shot_buffer = None
+
+        # Mouse snapshot taken once per loop iteration by poll_mouse()
+        self._mx, self._my, self._mdown = 0, 0, False
+        self._mouse_moved = False  # Pointer moved since the previous poll, keeps hover updates at frame rate
+
+        # Cached presets. The file is read by a background loader; it hands each fresh list over
+        # through _preset_loaded and get_presets() swaps it in on the UI thread
+        self._preset_cache = {}
+        self._preset_loaded = None
+        self._preset_reload = threading.Event()
+        self._preset_reload.set()  # Initial load
+        threading.Thread(target=self._preset_loader, daemon=True).start()
 
         # Track scale changes
         self._scale_changed = False
         self._original_scale = self.l.global_scale
 
+        # KEYDOWN dispatch tables for the active input box; other keys fall through to append
+        self._slider_key_handlers = {
+            pygame.K_BACKSPACE: self._slider_backspace,
+            pygame.K_RETURN: self._slider_commit,
+            pygame.K_KP_ENTER: self._slider_commit,
+        }
+        self._name_key_handlers = {
+            pygame.K_BACKSPACE: self._name_backspace,
+            pygame.K_RETURN: self._name_commit,
+        }
+
         logger.info("PygameUI initialization complete")
 
+    def _render_text(self, font, text, color):
+        """
+        Render text through a cache so unchanged labels aren't re-rasterized every frame.
+        Evicts the least recently used entry once TEXT_CACHE_MAX_ENTRIES is reached.
+
+        Args:
+            font: pygame.freetype Font to render with
+            text: String to render
+            color: RGB tuple
+
+        Returns:
+            pygame.Surface with the rendered text
+        """
+        key = (id(font), text, color)
+        cache = self._text_cache
+        surface = cache.pop(key, None)
+        if surface is None:
+            if len(cache) >= TEXT_CACHE_MAX_ENTRIES:
+                del cache[next(iter(cache))]
+            # Match the display format so cached blits skip per-pixel conversion
+            surface = font.render(text, color)[0].convert_alpha()
+        # Re-insert so dict order runs from least to most recently used
+        cache[key] = surface
+        return surface
+
+    def _build_bg_surface(self):
+        """
+        Draw everything that never changes between frames into a single surface
+        so each frame starts with one blit instead of redrawing the chrome.
+        Also builds the preset row template blitted once per saved preset.
+        """
+        bg = pygame.Surface((CONTROL_PANEL_WIDTH, CONTROL_PANEL_HEIGHT)).convert()
+        bg.fill(self.c_bg)
+
+        # Title
+        bg.blit(self._render_text(self.font_lg, "ThorCPY Control Panel", self.c_text),
+                (TITLE_MARGIN_X, TITLE_MARGIN_Y))
+        pygame.draw.line(bg, self.c_border, (TITLE_SEPARATOR_LEFT, TITLE_SEPARATOR_Y),
+                         (TITLE_SEPARATOR_RIGHT, TITLE_SEPARATOR_Y))
+
+        # Layout controls header
+        bg.blit(self._render_text(self.font_lg, "Layout Controls", self.c_text),
+                (LAYOUT_HEADER_X, LAYOUT_HEADER_Y))
+
+        # Slider labels; the launch scale only changes on restart, so its label is fixed too
+        for label, y_pos in (
+            (f"GLOBAL SCALE - Active: {self.l.launch_scale:.2f}", SLIDER_SCALE_Y),
+            ("TOP X", SLIDER_TOP_X_Y),
+            ("TOP Y", SLIDER_TOP_Y_Y),
+            ("BOTTOM X", SLIDER_BOTTOM_X_Y),
+            ("BOTTOM Y", SLIDER_BOTTOM_Y_Y),
+        ):
+            bg.blit(self._render_text(self.font_md, label, self.c_text), (SLIDER_LABEL_X, y_pos))
+
+        # Slider tracks and the dock button fill never change colour
+        for _, track_rect in self._slider_geom.values():
+            pygame.draw.rect(bg, self.c_border, track_rect, border_radius=SLIDER_TRACK_BORDER_RADIUS)
+        pygame.draw.rect(bg, self.c_panel, self._undock_btn, border_radius=5)
+
+        # Presets divider and header
+        pygame.draw.line(bg, self.c_border, (PRESET_DIVIDER_LEFT, PRESET_DIVIDER_Y),
+                         (PRESET_DIVIDER_RIGHT, PRESET_DIVIDER_Y))
+        bg.blit(self._render_text(self.font_lg, "Save New Preset", self.c_text),
+                (PRESET_HEADER_X, PRESET_HEADER_Y))
+
+        # Preset name input fill
+        pygame.draw.rect(bg, self.c_panel, self._input_rect, border_radius=5)
+
+        # Save button
+        pygame.draw.rect(bg, self.c_accent, self._save_btn, border_radius=PRESET_BORDER_RADIUS)
+        sv_txt = self._render_text(self.font_md, "SAVE", WHITE_TEXT)
+        bg.blit(sv_txt, sv_txt.get_rect(center=self._save_btn.center))
+
+        # Preset list header
+        bg.blit(self._render_text(self.font_lg, "Saved Presets", self.c_text),
+                (PRESET_LIST_HEADER_X, PRESET_LIST_HEADER_Y))
+
+        self._bg_surface = bg
+
+        # Preset row (background + LOAD/DEL buttons); rows sit on the plain bg so it can be opaque
+        row = pygame.Surface((PRESET_ROW_WIDTH, PRESET_ROW_HEIGHT)).convert()
+        row.fill(self.c_bg)
+        pygame.draw.rect(row, self.c_panel, row.get_rect(), border_radius=PRESET_BORDER_RADIUS)
+
+        l_btn = pygame.Rect(PRESET_LOAD_BUTTON_X - PRESET_ROW_X, PRESET_BUTTON_Y_OFFSET, PRESET_BUTTON_WIDTH,
+                            PRESET_BUTTON_HEIGHT)
+        pygame.draw.rect(row, self.c_success, l_btn, border_radius=BUTTON_BORDER_RADIUS)
+        l_txt = self._render_text(self.font_sm, "LOAD", BLACK_TEXT)
+        row.blit(l_txt, l_txt.get_rect(center=l_btn.center))
+
+        d_btn = pygame.Rect(PRESET_DELETE_BUTTON_X - PRESET_ROW_X, PRESET_BUTTON_Y_OFFSET, PRESET_BUTTON_WIDTH,
+                            PRESET_BUTTON_HEIGHT)
+        pygame.draw.rect(row, self.c_danger, d_btn, border_radius=BUTTON_BORDER_RADIUS)
+        d_txt = self._render_text(self.font_sm, "DEL", WHITE_TEXT)
+        row.blit(d_txt, d_txt.get_rect(center=d_btn.center))
+
+        self._row_template = row
+        logger.debug("Static UI background rendered")
+
+    def _rrect(self, size, color, radius, width=0):
+        """
+        Get a rounded rectangle pre-drawn on a transparent surface, drawing it on first use.
+        Blitting the cached surface is cheaper than rasterizing the rounded corners every frame.
+
+        Args:
+            size: (width, height) of the rectangle
+            color: RGB tuple
+            radius: Corner radius
+            width: Outline thickness, 0 for a filled rectangle
+
+        Returns:
+            pygame.Surface with the rectangle drawn at (0, 0)
+        """
+        key = (size, color, radius, width)
+        surface = self._rrect_cache.get(key)
+        if surface is None:
+            surface = pygame.Surface(size, pygame.SRCALPHA).convert_alpha()
+            pygame.draw.rect(surface, color, surface.get_rect(), width, border_radius=radius)
+            self._rrect_cache[key] = surface
+        return surface
+
+    def _get_preset_row(self, name):
+        """
+        Get the fully composited row surface for a preset, building it on first use.
+
+        Args:
+            name: Preset name drawn into the row
+
+        Returns:
+            pygame.Surface of PRESET_ROW_WIDTH x PRESET_ROW_HEIGHT
+        """
+        row = self._preset_row_cache.get(name)
+        if row is None:
+            row = self._row_template.copy()
+            # Rendered straight into the row: the row surface is the cache, so the name
+            # doesn't also need a slot in the per-frame text cache
+            name_txt = self.font_md.render(name, self.c_text)[0]
+            row.blit(name_txt, (PRESET_NAME_X_OFFSET, (PRESET_ROW_HEIGHT - name_txt.get_height()) // 2))
+            self._preset_row_cache[name] = row
+        return row
+
+    def _preset_loader(self):
+        """
+        Background thread that reloads the presets from disk whenever the cache is invalidated
+        """
+        while self.l.running:
+            self._preset_reload.wait()
+            self._preset_reload.clear()
+            self._preset_loaded = self.l.store.load_all()
+            pygame.event.post(pygame.event.Event(PRESETS_LOADED_EVENT))
+
+    def is_interactive(self):
+        """
+        Check whether the user is currently working the panel
+
+        Returns:
+            bool: True while a slider is dragged, an input box is active, the mouse button is held
+            or the pointer is moving
+        """
+        return bool(
+            self.dragging
+            or self.active_input
+            or self.active_slider_input
+            or self._mdown
+            or self._mouse_moved
+        )
+
+    def poll_mouse(self):
+        """
+        Snapshot the mouse position and left button state for this loop iteration.
+        render() and is_interactive() read the snapshot instead of querying SDL themselves
+        """
+        pos = pygame.mouse.get_pos()
+        self._mouse_moved = pos != (self._mx, self._my)
+        self._mx, self._my = pos
+        self._mdown = pygame.mouse.get_pressed()[0]
+
     def invalidate_preset_cache(self):
-        """Force preset list to reload on the next access"""
-        self._preset_cache = None
+        """Schedule a background reload of the preset list"""
+        self._preset_reload.set()
         logger.debug("Preset cache invalidated")
 
     def get_presets(self):
         """
         Get preset list with caching to reduce file I/O.
-        Cache is invalidated after PRESET_CACHE_TIME seconds or manually via invalidate_preset_cache().
+        The presets are only reloaded after invalidate_preset_cache(), which every save/delete calls,
+        and the read happens on the loader thread so the UI never blocks on the preset file.
 
         Returns:
             dict: Preset name -> preset data mapping
         """
-        current_time = time.time()
+        loaded = self._preset_loaded
+        if loaded is not None and loaded is not self._preset_cache:
+            self._preset_cache = loaded
+            self._preset_row_blits = None
+            self._dirty = True
 
-        if self._preset_cache is None or (current_time - self._preset_cache_time) > PRESET_CACHE_TIME:
-            self._preset_cache = self.l.store.load_all()
-            self._preset_cache_time = current_time
-            logger.debug(
-                f"Preset cache refreshed with {len(self._preset_cache)} presets"
-            )
+            # Drop rendered rows for presets that no longer exist
+            for name in [n for n in self._preset_row_cache if n not in self._preset_cache]:
+                del self._preset_row_cache[name]
+            logger.debug("Preset cache refreshed with %d presets", len(self._preset_cache))
 
         return self._preset_cache
 
@@ -480,22 +978,26 @@ class PygameUI:
             status_type: Type of message (info, success, error, warning)
             duration: How long to show the message in seconds
         """
-        logger.debug(f"Showing status: [{status_type}] {msg}")
+        logger.debug("Showing status: [%s] %s", status_type, msg)
         self.status_msg = msg
         self.status_type = status_type
-        self.status_time = time.time()
+        self.status_time = time.monotonic()
         self.status_duration = duration
+        self._dirty = True
+
+        # One-shot wake-up to clear the message; re-arming replaces any pending timer.
+        # The extra millisecond keeps the timer from landing just before the message expires
+        pygame.time.set_timer(STATUS_EXPIRE_EVENT, int(duration * 1000) + 1, loops=1)
 
     def take_screenshot(self):
         """
         Takes a screenshot of both windows and copies it to the clipboard
 
-        Uses windows GDI to get the container window's client area
+        Uses PrintWindow to grab the container's composited client area,
+        falling back to a GDI BitBlt if that fails. The capture buffer is reused between screenshots
         Only works when windows are docked
         """
         logger.info("Taking screenshot of docked windows")
-        user32 = windll.user32
-        gdi32 = windll.gdi32
 
         try:
             if not self.l.hwnd_container or not self.l.docked:
@@ -523,430 +1025,519 @@ class PygameUI:
                 self.show_status("Screenshot failed", "error")
                 return
 
-            mem_dc = gdi32.CreateCompatibleDC(hwnd_dc)
-            if not mem_dc:
-                logger.error("Failed to create compatible DC")
+            # The window DC is only needed for the capture itself, and is released even if it raises
+            try:
+                buffer = self._get_screenshot_buffer(hwnd_dc, w, h)
+                if buffer is None:
+                    self.show_status("Screenshot failed", "error")
+                    return
+                mem_dc, header, bits = buffer
+
+                # Copy the client area pixels, asking DWM for the composited surface first
+                success = user32.PrintWindow(self.l.hwnd_container, mem_dc, PW_CLIENTONLY | PW_RENDERFULLCONTENT)
+                if not success:
+                    logger.debug("PrintWindow failed, falling back to BitBlt")
+                    success = gdi32.BitBlt(mem_dc, 0, 0, w, h, hwnd_dc, 0, 0, SRCCOPY)
+            finally:
                 user32.ReleaseDC(self.l.hwnd_container, hwnd_dc)
-                self.show_status("Screenshot failed", "error")
-                return
-
-            bitmap = gdi32.CreateCompatibleBitmap(hwnd_dc, w, h)
-            if not bitmap:
-                logger.error("Failed to create compatible bitmap")
-                gdi32.DeleteDC(mem_dc)
-                user32.ReleaseDC(self.l.hwnd_container, hwnd_dc)
-                self.show_status("Screenshot failed", "error")
-                return
-
-            # Copy pixels to bitmap
-            old_bitmap = gdi32.SelectObject(mem_dc, bitmap)
-            success = gdi32.BitBlt(mem_dc, 0, 0, w, h, hwnd_dc, 0, 0, SRCCOPY)
 
             if not success:
-                logger.error("BitBlt failed during screenshot")
+                logger.error("PrintWindow and BitBlt failed during screenshot")
                 self.show_status("Screenshot failed", "error")
-            else:
-                # Copy the bitmap to clipboard
-                user32.OpenClipboard(0)
-                user32.EmptyClipboard()
-                user32.SetClipboardData(CF_BITMAP, bitmap)
-                user32.CloseClipboard()
+            elif self._copy_dib_to_clipboard(header, bits):
                 logger.info("Screenshot copied to clipboard successfully")
                 self.show_status("Screenshot copied to clipboard", "success")
-
-            # Cleanup GDI objects
-            gdi32.SelectObject(mem_dc, old_bitmap)
-            gdi32.DeleteObject(bitmap)
-            gdi32.DeleteDC(mem_dc)
-            user32.ReleaseDC(self.l.hwnd_container, hwnd_dc)
+            else:
+                self.show_status("Screenshot failed", "error")
 
         except Exception as ScreenshotErrot:
             logger.error(f"Screenshot error: {ScreenshotErrot}", exc_info=True)
             self.show_status("Screenshot failed", "error")
 
-    def draw_slider(self, label, y_pos, val, min_val, max_val, color, attr_name):
+    def _get_screenshot_buffer(self, hwnd_dc, w, h):
+        """
+        Get the memory DC and DIB section screenshots are captured into.
+        They are kept between screenshots and only recreated when the container size changes
+
+        Args:
+            hwnd_dc: Container window DC the memory DC is made compatible with
+            w: Capture width in pixels
+            h: Capture height in pixels
+
+        Returns:
+            tuple or None: (mem_dc, header, bits), or None if the GDI objects couldn't be created
+        """
+        cached = self._shot_buffer
+        if cached is not None and cached[5:] == (w, h):
+            return cached[0], cached[3], cached[4]
+        self._release_screenshot_buffer()
+
+        mem_dc = gdi32.CreateCompatibleDC(hwnd_dc)
+        if not mem_dc:
+            logger.error("Failed to create compatible DC")
+            return None
+
+        # Bottom-up 32-bit DIB section: its pixels are directly addressable and already
+        # laid out the way CF_DIB expects, so the clipboard copy is a single memmove
+        header = BITMAPINFOHEADER(
+            biSize=sizeof(BITMAPINFOHEADER),
+            biWidth=w,
+            biHeight=h,
+            biPlanes=1,
+            biBitCount=SCREENSHOT_BIT_COUNT,
+            biCompression=BI_RGB,
+            biSizeImage=w * h * (SCREENSHOT_BIT_COUNT // 8),
+        )
+        bits = c_void_p()
+        bitmap = gdi32.CreateDIBSection(hwnd_dc, byref(header), DIB_RGB_COLORS, byref(bits), None, 0)
+        if not bitmap:
+            logger.error("Failed to create DIB section")
+            gdi32.DeleteDC(mem_dc)
+            return None
+
+        old_bitmap = gdi32.SelectObject(mem_dc, bitmap)
+        self._shot_buffer = (mem_dc, bitmap, old_bitmap, header, bits, w, h)
+        logger.debug(f"Screenshot buffer created: {w}x{h}")
+        return mem_dc, header, bits
+
+    def _release_screenshot_buffer(self):
+        """Delete the cached screenshot memory DC and DIB section, if any"""
+        if self._shot_buffer is None:
+            return
+        mem_dc, bitmap, old_bitmap = self._shot_buffer[:3]
+        gdi32.SelectObject(mem_dc, old_bitmap)
+        gdi32.DeleteObject(bitmap)
+        gdi32.DeleteDC(mem_dc)
+        self._shot_buffer = None
+
+    @staticmethod
+    def _copy_dib_to_clipboard(header, bits):
+        """
+        Place a DIB section's pixels on the clipboard as CF_DIB
+
+        Args:
+            header: BITMAPINFOHEADER the DIB section was created with
+            bits: Pointer to the DIB section's pixel data
+
+        Returns:
+            bool: True if the clipboard now holds the image
+        """
+        gdi32.GdiFlush()  # Make sure GDI has finished drawing into the DIB
+        header_size = sizeof(header)
+        h_mem = kernel32.GlobalAlloc(GMEM_MOVEABLE, header_size + header.biSizeImage)
+        if not h_mem:
+            logger.error("Failed to allocate clipboard memory")
+            return False
+
+        ptr = kernel32.GlobalLock(h_mem)
+        if not ptr:
+            logger.error("Failed to lock clipboard memory")
+            kernel32.GlobalFree(h_mem)
+            return False
+        memmove(ptr, byref(header), header_size)
+        memmove(ptr + header_size, bits, header.biSizeImage)
+        kernel32.GlobalUnlock(h_mem)
+
+        if not user32.OpenClipboard(0):
+            logger.error("Failed to open clipboard")
+            kernel32.GlobalFree(h_mem)
+            return False
+        try:
+            user32.EmptyClipboard()
+            # On success the clipboard owns h_mem
+            if not user32.SetClipboardData(CF_DIB, h_mem):
+                logger.error("SetClipboardData failed")
+                kernel32.GlobalFree(h_mem)
+                return False
+        finally:
+            user32.CloseClipboard()
+        return True
+
+    def draw_slider(self, val, color, attr_name, mouse):
         """
         Draw a slider control with editable value box
+        The slider's label is part of the static background
 
         Args:
-            label: Label text for the slider
-            y_pos: Y position to draw at
             val: Current value
-            min_val: Minimum value
-            max_val: Maximum value
             color: Color for the slider
-            attr_name: Attribute name (tx, ty, bx, by) for keyboard input
-        """
-        try:
-            mx, my = pygame.mouse.get_pos()
-            m_click = pygame.mouse.get_pressed()[0]
-
-            # Draw label
-            self.screen.blit(self.font_md.render(label, True, self.colors["text"]),
-                             (SLIDER_LABEL_X, y_pos))
-
-            # Value display box
-            val_box = pygame.Rect(SLIDER_RECT_LEFT, y_pos, SLIDER_RECT_WIDTH, SLIDER_RECT_HEIGHT)
-            box_hover = val_box.collidepoint(mx, my)
-            box_active = self.active_slider_input == attr_name
-
-            box_color = (
-                self.colors["accent"]
-                if box_active
-                else (self.colors["border"] if box_hover else self.colors["panel"])
-            )
-            pygame.draw.rect(self.screen, box_color, val_box, border_radius=SLIDER_BORDER_RADIUS)
+            attr_name: Attribute name (global_scale, tx, ty, bx, by), also keys the slider geometry and range
+            mouse: (x, y, left_button_down, hovered_rect) as read once per frame by render()
 
-            # Format value text
-            if box_active:
-                val_text = self.input_buffer
-            elif attr_name == "global_scale":
-                val_text = f"{val:.2f}"
+        Returns:
+            tuple: What was drawn (box colour, value surface, handle colour, handle x), so
+            render() can tell whether the slider's row needs pushing to the display
+        """
+        mx, my, m_click, hovered = mouse
+
+        # Value display box comes from the precomputed geometry
+        val_box = self._slider_geom[attr_name][0]
+        box_hover = hovered is val_box
+        box_active = self.active_slider_input == attr_name
+
+        box_color = (
+            self.c_accent
+            if box_active
+            else (self.c_border if box_hover else self.c_panel)
+        )
+        blits = self._frame_blits
+        blits.append((self._rrect(val_box.size, box_color, SLIDER_BORDER_RADIUS), val_box))
+
+        # Value text; while the value is unchanged the rendered surface and its centred
+        # position are reused as-is, without formatting or a text cache lookup
+        if box_active:
+            val_render = self._render_text(self.font_sm, self.input_buffer, self.c_text)
+            val_pos = val_render.get_rect(center=val_box.center)
+        else:
+            last = self._val_str_cache.get(attr_name)
+            if last is not None and last[0] == val:
+                val_render, val_pos = last[1], last[2]
             else:
-                val_text = str(int(val))
-
-            val_render = self.font_sm.render(val_text, True, self.colors["text"])
-            val_rect = val_render.get_rect(center=val_box.center)
-            self.screen.blit(val_render, val_rect)
-
-            # Activate keyboard input on click
-            if m_click and box_hover and not self.m_locked:
-                if not box_active:
-                    self.active_slider_input = attr_name
-                    if attr_name == "global_scale":
-                        self.input_buffer = f"{val:.2f}"
-                    else:
-                        self.input_buffer = str(int(val))
-                    self.active_input = False
-                    logger.debug(f"Activated slider input for {attr_name}")
-                self.m_locked = True
-
-            # Draw slider Track
-            track_y = y_pos + SLIDER_TRACK_OFFSET_Y
-            track_rect = pygame.Rect(SLIDER_TRACK_RECT_LEFT, track_y, SLIDER_TRACK_RECT_WIDTH,
-                                     SLIDER_TRACK_RECT_HEIGHT)
-            pygame.draw.rect(
-                self.screen, self.colors["border"], track_rect, border_radius=SLIDER_TRACK_BORDER_RADIUS
-            )
-
-            # Calculate handle position
-            norm_val = ((val - min_val) / (max_val - min_val) if max_val != min_val else SLIDER_HANDLE_FALLBACK_VALUE)
-            handle_x = SLIDER_LABEL_X + int(norm_val * SLIDER_TRACK_RECT_WIDTH)
-            handle_rect = pygame.Rect(handle_x - SLIDER_HANDLE_OFFSET_X, track_y - SLIDER_HANDLE_OFFSET_Y,
-                                      SLIDER_HANDLE_WIDTH, SLIDER_HANDLE_HEIGHT)
-            handle_hover = handle_rect.collidepoint(mx, my)
-
-            # Handle with hover feedback
-            handle_color = (
-                self.colors["text"]
-                if handle_hover or self.dragging == attr_name
-                else color
-            )
-            pygame.draw.circle(self.screen, handle_color, (handle_x, track_y + 2), 8)
-
-            # Start drag on click
-            if m_click and handle_hover and not self.m_locked and not self.dragging:
-                self.dragging = attr_name
-                logger.debug(f"Started dragging slider: {attr_name}")
-
-            # Update value whilst dragging
-            if self.dragging == attr_name and m_click:
-                new_norm = max(SLIDER_DRAG_MINIMUM, min(SLIDER_DRAG_MAXIMUM,
-                                                        (mx - SLIDER_TRACK_RECT_LEFT) / SLIDER_TRACK_RECT_WIDTH))
-                new_val = min_val + new_norm * (max_val - min_val)
-                setattr(self.l, attr_name, new_val)
-
-                # Check to see if global scale has changed
-                if (
-                    attr_name == "global_scale"
-                    and abs(new_val - self._original_scale) > SCALE_CHANGE_MIN_DETECTION
-                ):
-                    self._scale_changed = True
+                val_text = f"{val:.2f}" if attr_name == "global_scale" else str(int(val))
+                val_render = self._render_text(self.font_sm, val_text, self.c_text)
+                val_pos = val_render.get_rect(center=val_box.center)
+                self._val_str_cache[attr_name] = (val, val_render, val_pos)
+        blits.append((val_render, val_pos))
+
+        # Activate keyboard input on click
+        if m_click and box_hover and not self.m_locked:
+            if not box_active:
+                self.active_slider_input = attr_name
+                if attr_name == "global_scale":
+                    self.input_buffer = f"{val:.2f}"
+                else:
+                    self.input_buffer = str(int(val))
+                self.active_input = False
+                self._dirty = True
+                logger.debug("Activated slider input for %s", attr_name)
+            self.m_locked = True
+
+        # Calculate handle position (the track itself is part of the static background)
+        min_val, span, px_per_unit = self._slider_ranges[attr_name]
+        handle_x = SLIDER_LABEL_X + int((val - min_val) * px_per_unit)
+        handle_rect = self._slider_handles[attr_name]
+        handle_rect.x = handle_x - SLIDER_HANDLE_OFFSET_X
+        handle_hover = handle_rect.collidepoint(mx, my)
+
+        # Handle with hover feedback
+        handle_color = (
+            self.c_text
+            if handle_hover or self.dragging == attr_name
+            else color
+        )
+        # Round handle: a rounded rect whose radius is half its size, so it batches like the rest
+        blits.append((self._rrect(handle_rect.size, handle_color, SLIDER_HANDLE_WIDTH // 2), handle_rect))
+
+        # Start drag on click
+        if m_click and handle_hover and not self.m_locked and not self.dragging:
+            self.dragging = attr_name
+            logger.debug("Started dragging slider: %s", attr_name)
+
+        # Update value whilst dragging
+        if self.dragging == attr_name and m_click:
+            new_norm = max(SLIDER_DRAG_MINIMUM, min(SLIDER_DRAG_MAXIMUM,
+                                                    (mx - SLIDER_TRACK_RECT_LEFT) / SLIDER_TRACK_RECT_WIDTH))
+            new_val = min_val + new_norm * span
+            self._slider_setters[attr_name](new_val)
+            self._last_sync_key = None
+            self._dirty = True
+
+            # Check to see if global scale has changed
+            if (
+                attr_name == "global_scale"
+                and abs(new_val - self._original_scale) > SCALE_CHANGE_MIN_DETECTION
+            ):
+                self._scale_changed = True
 
-            # Save on drag release
-            if not m_click and self.dragging == attr_name:
-                logger.debug(f"Stopped dragging slider: {attr_name}")
-                # Save scale separately when scale slider released
+        # Save on drag release
+        if not m_click and self.dragging == attr_name:
+            logger.debug("Stopped dragging slider: %s", attr_name)
+            # Save scale separately when scale slider released
+            try:
                 if attr_name == "global_scale":
                     self.l.save_scale()
                 else:
                     self.l.save_layout()
-                self.dragging = None
+            except OSError as SliderSaveError:
+                logger.error(f"Failed to save slider '{attr_name}': {SliderSaveError}")
+                self.show_status("Failed to save layout", "error", duration=ERROR_STATUS_DURATION)
+            self.dragging = None
+            self._dirty = True
 
-        except Exception as SliderDrawError:
-            logger.error(f"Error drawing slider '{label}': {SliderDrawError}", exc_info=True)
+        return box_color, val_render, handle_color, handle_rect.x
 
     def render(self):
         """
         Main render loop for the UI
         Draws all UI elements and handles the mouse interactions
+        Idle frames (no input, drag or status change) are skipped entirely,
+        as is every frame while the panel is minimized
         """
-        try:
-            mx, my = pygame.mouse.get_pos()
-            m_click = pygame.mouse.get_pressed()[0]
-
-            self.screen.fill(self.colors["bg"])
-
-            # Title
-            title_txt = self.font_lg.render("ThorCPY Control Panel", True, self.colors["text"])
-            self.screen.blit(title_txt, (TITLE_MARGIN_X, TITLE_MARGIN_Y))
-
-            pygame.draw.line(self.screen, self.colors["border"], (TITLE_SEPARATOR_LEFT, TITLE_SEPARATOR_Y),
-                             (TITLE_SEPARATOR_RIGHT, TITLE_SEPARATOR_Y))
-
-            # Layout controls header
-            self.screen.blit(
-                self.font_lg.render("Layout Controls", True, self.colors["text"]),
-                (LAYOUT_HEADER_X, LAYOUT_HEADER_Y),
-            )
-
-            # Global Scale Slider
-            scale_label = (
-                f"GLOBAL SCALE - Active: {self.l.launch_scale:.2f}"
-            )
-            self.draw_slider(
-                scale_label,
-                SLIDER_SCALE_Y,
-                self.l.global_scale,
-                GLOBAL_SCALE_MIN,
-                GLOBAL_SCALE_MAX,
-                self.colors["accent"],
-                "global_scale",
-            )
-
-            # Restart notification for if the scale has changed
-            if hasattr(self, "_scale_changed") and self._scale_changed:
-                restart_txt = self.font_sm.render(
-                    "Restart ThorCPY to apply scale", True, self.colors["warning"]
-                )
-                self.screen.blit(restart_txt, (RESTART_NOTIF_X, RESTART_NOTIF_Y))
-
-            # Sliders
-            self.draw_slider(
-                "TOP X", SLIDER_TOP_X_Y, self.l.tx, SCREEN_MIN_POS, SCREEN_MAX_POS,
-                self.colors["top"], "tx"
-            )
-            self.draw_slider(
-                "TOP Y", SLIDER_TOP_Y_Y, self.l.ty, SCREEN_MIN_POS, SCREEN_MAX_POS,
-                self.colors["top"], "ty"
-            )
-            self.draw_slider(
-                "BOTTOM X", SLIDER_BOTTOM_X_Y, self.l.bx, SCREEN_MIN_POS, SCREEN_MAX_POS,
-                self.colors["bot"], "bx"
-            )
-            self.draw_slider(
-                "BOTTOM Y", SLIDER_BOTTOM_Y_Y, self.l.by, SCREEN_MIN_POS, SCREEN_MAX_POS,
-                self.colors["bot"], "by"
-            )
-
-            # Undock/Dock Button
-            undock_btn = pygame.Rect(UNDOCK_BUTTON_X, UNDOCK_BUTTON_Y, UNDOCK_BUTTON_WIDTH, UNDOCK_BUTTON_HEIGHT)
-            u_hover = undock_btn.collidepoint(mx, my)
-            btn_text = "DOCK  WINDOWS" if not self.l.docked else "UNDOCK  WINDOWS"
-
-            btn_color = self.colors["panel"]
-            text_color = self.colors["text"]
-
-            pygame.draw.rect(self.screen, btn_color, undock_btn, border_radius=5)
-            utxt = self.font_md.render(btn_text, True, text_color)
-            text_rect = utxt.get_rect(center=undock_btn.center)
-            self.screen.blit(utxt, text_rect)
-
-            # Dock button logic
-            if m_click and u_hover and not self.m_locked and not self.dragging:
-                self.pressed_button = "dock"
-
-            if not m_click and self.pressed_button == "dock":
-                if u_hover:
-                    logger.info("Dock toggle button clicked")
-                    self.l.toggle_dock()
-                self.pressed_button = None
-
-            # Screenshot Button
-            shot_btn = pygame.Rect(SCREENSHOT_BUTTON_X, SCREENSHOT_BUTTON_Y, SCREENSHOT_BUTTON_WIDTH,
-                                   SCREENSHOT_BUTTON_HEIGHT)
-            s_hover = shot_btn.collidepoint(mx, my)
-
-            if self.l.docked:
-                s_color = self.colors["panel"] if not s_hover else self.colors["border"]
-                s_text_color = self.colors["text"]
-                s_label = "SCREENSHOT"
-            else:
-                s_color = (45, 48, 56)
-                s_text_color = (100, 105, 115)
-                s_label = "LOCKED (UNDOCKED)"
-
-            pygame.draw.rect(self.screen, s_color, shot_btn, border_radius=5)
-            stxt = self.font_md.render(s_label, True, s_text_color)
-            stxt_rect = stxt.get_rect(center=shot_btn.center)
-            self.screen.blit(stxt, stxt_rect)
-
-            if (
-                s_hover
-                and m_click
-                and not self.m_locked
-                and self.l.docked
-                and not self.dragging
-            ):
-                self.take_screenshot()
-                self.m_locked = True
-
-            # Status Messages
-            if time.time() - self.status_time < self.status_duration:
-                color_map = {
-                    "success": self.colors["success"],
-                    "error": self.colors["danger"],
-                    "warning": self.colors["warning"],
-                    "info": self.colors["text"],
-                }
-                status_color = color_map.get(self.status_type, self.colors["text"])
-                status_txt = self.font_sm.render(self.status_msg, True, status_color)
-                self.screen.blit(status_txt, (STATUS_TEXT_X, STATUS_TEXT_Y))
-
-            # Presets
-            pygame.draw.line(self.screen, self.colors["border"], (PRESET_DIVIDER_LEFT, PRESET_DIVIDER_Y),
-                             (PRESET_DIVIDER_RIGHT, PRESET_DIVIDER_Y))
-
-            # Save Preset button
-            self.screen.blit(
-                self.font_lg.render("Save New Preset", True, self.colors["text"]),
-                (PRESET_HEADER_X, PRESET_HEADER_Y),
-            )
-            input_rect = pygame.Rect(PRESET_INPUT_X, PRESET_Y, PRESET_INPUT_WIDTH, PRESET_HEIGHT)
-            name_color = (
-                self.colors["accent"] if self.active_input else self.colors["border"]
-            )
-            pygame.draw.rect(
-                self.screen, self.colors["panel"], input_rect, border_radius=5
+        if self._pending_sync:
+            self._pending_sync = False
+            self.force_window_sync()
+
+        # Nothing drawn can be seen; _dirty stays set, so the first frame after a restore redraws
+        if not self._visible:
+            return
+
+        mx, my, m_click = self._mx, self._my, self._mdown
+
+        # Skip idle frames: nothing changed and no drag. Status expiry arrives as STATUS_EXPIRE_EVENT.
+        # The layout values are part of the state so changes made outside the UI still redraw
+        l = self.l
+        frame_state = (mx, my, m_click, l.tx, l.ty, l.bx, l.by, l.global_scale, l.docked)
+        if not (self._dirty or self.dragging or frame_state != self._last_frame_state):
+            return
+        self._dirty = False
+        self._last_frame_state = frame_state
+        status_active = time.monotonic() - self.status_time < self.status_duration
+
+        # Resolve which fixed widget (if any) is under the mouse; they never overlap
+        self._mouse_rect.topleft = (mx, my)
+        hit = self._mouse_rect.collidelist(self._hit_rects)
+        hovered = self._hit_rects[hit] if hit != -1 else None
+        mouse = (mx, my, m_click, hovered)
+
+        # Static chrome (background, headers, dividers, save button)
+        if self._bg_surface is None:
+            self._build_bg_surface()
+        self.screen.blit(self._bg_surface, (0, 0))
+
+        # Everything drawn on top of the background is queued here and blitted in one batch
+        blits = self._frame_blits
+        blits.clear()
+
+        # Global Scale Slider. Region states are collected in _update_rects order
+        region_states = [self.draw_slider(self.l.global_scale, self.c_accent, "global_scale", mouse)]
+
+        # Restart notification for if the scale has changed
+        if self._scale_changed:
+            restart_txt = self._render_text(
+                self.font_sm, "Restart ThorCPY to apply scale", self.c_warning
             )
-            pygame.draw.rect(self.screen, name_color, input_rect, 1, border_radius=5)
-
-            name_txt = self.font_md.render(self.preset_name, True, self.colors["text"])
-            name_rect = name_txt.get_rect(
-                midleft=(input_rect.left + PRESET_TEXT_PADDING_X, input_rect.centery)
-            )
-            self.screen.blit(name_txt, name_rect)
-
-            # Save button
-            save_btn = pygame.Rect(PRESET_SAVE_BUTTON_X, PRESET_Y, PRESET_SAVE_BUTTON_WIDTH, PRESET_HEIGHT)
-            pygame.draw.rect(self.screen, self.colors["accent"], save_btn, border_radius=PRESET_BORDER_RADIUS)
-
-            sv_txt = self.font_md.render("SAVE", True, WHITE_TEXT)
-            sv_rect = sv_txt.get_rect(center=save_btn.center)
-            self.screen.blit(sv_txt, sv_rect)
-
-            # Preset List
-            self.screen.blit(
-                self.font_lg.render("Saved Presets", True, self.colors["text"]),
-                (PRESET_LIST_HEADER_X, PRESET_LIST_HEADER_Y),
-            )
-            presets = self.get_presets()
-            y_offset = PRESET_LIST_Y_OFFSET
-
-            # List out all the presets from the json
-            for name, data in presets.items():
-                row_rect = pygame.Rect(PRESET_ROW_X, y_offset, PRESET_ROW_WIDTH, PRESET_ROW_HEIGHT)
-                pygame.draw.rect(
-                    self.screen, self.colors["panel"], row_rect, border_radius=PRESET_BORDER_RADIUS
-                )
-
-                name_txt = self.font_md.render(name, True, self.colors["text"])
-                name_y = y_offset + (PRESET_ROW_HEIGHT  - name_txt.get_height()) // 2
-                self.screen.blit(name_txt, (PRESET_ROW_X + PRESET_NAME_X_OFFSET, name_y))
-
-                # Load button
-                l_btn = pygame.Rect(PRESET_LOAD_BUTTON_X, y_offset + PRESET_BUTTON_Y_OFFSET, PRESET_BUTTON_WIDTH,
-                                    PRESET_BUTTON_HEIGHT)
-                pygame.draw.rect(self.screen, self.colors["success"], l_btn, border_radius=BUTTON_BORDER_RADIUS)
-
-                l_txt = self.font_sm.render("LOAD", True, BLACK_TEXT)
-                self.screen.blit(l_txt, l_txt.get_rect(center=l_btn.center))
-
-                # Delete Button
-                d_btn = pygame.Rect(PRESET_DELETE_BUTTON_X, y_offset + PRESET_BUTTON_Y_OFFSET, PRESET_BUTTON_WIDTH,
-                                    PRESET_BUTTON_HEIGHT)
-                pygame.draw.rect(self.screen, self.colors["danger"], d_btn, border_radius=BUTTON_BORDER_RADIUS)
-
-                d_txt = self.font_sm.render("DEL", True, WHITE_TEXT)
-                self.screen.blit(d_txt, d_txt.get_rect(center=d_btn.center))
-
-                # Load and delete interaction logic
-                if m_click and not self.m_locked:
-                    if l_btn.collidepoint(mx, my):
-                        logger.info(f"Loading preset: {name}")
-
-                        # Scale positions if preset was created at a different scale
-                        preset_scale = data.get("global_scale", self.l.launch_scale)
-                        current_scale = (self.l.launch_scale)
+            blits.append((restart_txt, (RESTART_NOTIF_X, RESTART_NOTIF_Y)))
+
+        # Sliders
+        for (attr, color), val in zip(self._position_sliders, self._position_values(l)):
+            region_states.append(self.draw_slider(val, color, attr, mouse))
+
+        # Undock/Dock Button
+        undock_btn = self._undock_btn
+        u_hover = hovered is undock_btn
+        btn_text = "DOCK  WINDOWS" if not self.l.docked else "UNDOCK  WINDOWS"
+
+        # Button fill is part of the static background
+        utxt = self._render_text(self.font_md, btn_text, self.c_text)
+        blits.append((utxt, utxt.get_rect(center=undock_btn.center)))
+
+        # Dock button logic
+        if m_click and u_hover and not self.m_locked and not self.dragging:
+            self.pressed_button = "dock"
+
+        if not m_click and self.pressed_button == "dock":
+            if u_hover:
+                logger.info("Dock toggle button clicked")
+                self.l.toggle_dock()
+                self._last_sync_key = None
+            self.pressed_button = None
+            self._dirty = True
+
+        # Screenshot Button
+        shot_btn = self._shot_btn
+        s_hover = hovered is shot_btn
+
+        if self.l.docked:
+            s_color = self.c_panel if not s_hover else self.c_border
+            s_text_color = self.c_text
+            s_label = "SCREENSHOT"
+        else:
+            s_color = (45, 48, 56)
+            s_text_color = (100, 105, 115)
+            s_label = "LOCKED (UNDOCKED)"
+
+        blits.append((self._rrect(shot_btn.size, s_color, 5), shot_btn))
+        stxt = self._render_text(self.font_md, s_label, s_text_color)
+        blits.append((stxt, stxt.get_rect(center=shot_btn.center)))
+
+        if (
+            s_hover
+            and m_click
+            and not self.m_locked
+            and self.l.docked
+            and not self.dragging
+        ):
+            self.take_screenshot()
+            self.m_locked = True
+
+        # Status Messages
+        if status_active:
+            status_color = self._status_color_map.get(self.status_type, self.c_text)
+            status_txt = self._render_text(self.font_sm, self.status_msg, status_color)
+            blits.append((status_txt, (STATUS_TEXT_X, STATUS_TEXT_Y)))
+
+        # Preset name input (the fill is part of the static background)
+        input_rect = self._input_rect
+        name_color = (
+            self.c_accent if self.active_input else self.c_border
+        )
+        blits.append((self._rrect(input_rect.size, name_color, 5, 1), input_rect))
+
+        name_txt = self._render_text(self.font_md, self.preset_name, self.c_text)
+        name_rect = name_txt.get_rect(
+            midleft=(input_rect.left + PRESET_TEXT_PADDING_X, input_rect.centery)
+        )
+        blits.append((name_txt, name_rect))
+
+        # Restart notice, undock button, screenshot button, status line and name input
+        region_states += [
+            self._scale_changed,
+            btn_text,
+            (s_color, s_label),
+            (self.status_msg, self.status_type) if status_active else None,
+            (name_color, self.preset_name),
+        ]
+
+        # Save button (drawn in the static background)
+        save_btn = self._save_btn
+
+        # Preset List
+        presets = self.get_presets()
+
+        # List out all the presets from the json; each row (background, name, buttons) is one
+        # cached surface, queued behind the widgets before the whole frame is blitted at once
+        if self._preset_row_blits is None:
+            self._preset_names = list(presets)
+            self._preset_row_blits = [
+                (self._get_preset_row(name), (PRESET_ROW_X, PRESET_LIST_Y_OFFSET + i * PRESET_ROW_SPACING))
+                for i, name in enumerate(presets)
+            ]
+            self._full_flip = True
+        blits += self._preset_row_blits
+        self._blit_batch(blits)
+
+        # Load and delete interaction logic: rows are evenly spaced, so the clicked row and
+        # button follow from the mouse position without testing every row. Clicks outside the
+        # button columns of the list are rejected before any row maths
+        if (
+            m_click
+            and not self.m_locked
+            and presets
+            and my >= PRESET_LIST_Y_OFFSET
+            and PRESET_LOAD_BUTTON_X <= mx < PRESET_DELETE_BUTTON_X + PRESET_BUTTON_WIDTH
+        ):
+            row_idx, row_y = divmod(my - PRESET_LIST_Y_OFFSET, PRESET_ROW_SPACING)
+            on_button_row = PRESET_BUTTON_Y_OFFSET <= row_y < PRESET_BUTTON_Y_OFFSET + PRESET_BUTTON_HEIGHT
+            if 0 <= row_idx < len(presets) and on_button_row:
+                name = self._preset_names[row_idx]
+                data = presets[name]
+                if PRESET_LOAD_BUTTON_X <= mx < PRESET_LOAD_BUTTON_X + PRESET_BUTTON_WIDTH:
+                    logger.info("Loading preset: %s", name)
+
+                    # Scale positions if preset was created at a different scale. A hand-edited or
+                    # older entry may miss keys or hold bad values, so nothing is applied until all
+                    # four positions have been worked out
+                    l = self.l
+                    current_scale = l.launch_scale
+                    try:
+                        preset_scale = data.get("global_scale", current_scale)
+                        d_tx, d_ty, d_bx, d_by = data["tx"], data["ty"], data["bx"], data["by"]
 
                         if abs(preset_scale - current_scale) > SCALE_CHANGE_MIN_DETECTION:
                             scale_factor = current_scale / preset_scale
-                            self.l.tx = int(data["tx"] * scale_factor)
-                            self.l.ty = int(data["ty"] * scale_factor)
-                            self.l.bx = int(data["bx"] * scale_factor)
-                            self.l.by = int(data["by"] * scale_factor)
+                            if scale_factor.is_integer():
+                                # Whole-number ratios (e.g. 2x DPI presets) stay in integer math
+                                factor = int(scale_factor)
+                                positions = (
+                                    int(d_tx) * factor, int(d_ty) * factor,
+                                    int(d_bx) * factor, int(d_by) * factor,
+                                )
+                            else:
+                                positions = (
+                                    int(d_tx * scale_factor), int(d_ty * scale_factor),
+                                    int(d_bx * scale_factor), int(d_by * scale_factor),
+                                )
                             logger.info(
-                                f"Scaled preset from {preset_scale} to {current_scale} (factor: {scale_factor:.2f})"
+                                "Scaled preset from %s to %s (factor: %.2f)", preset_scale, current_scale, scale_factor
                             )
                         else:
-                            self.l.tx, self.l.ty = data["tx"], data["ty"]
-                            self.l.bx, self.l.by = data["bx"], data["by"]
-
-                        # Force immediate sync after loading preset
-                        self.force_window_sync()
+                            positions = (int(d_tx), int(d_ty), int(d_bx), int(d_by))
+                    except (AttributeError, KeyError, TypeError, ValueError, ZeroDivisionError) as PresetLoadError:
+                        logger.error(f"Malformed preset '{name}': {PresetLoadError!r}")
+                        self.show_status("Preset is invalid", "error", duration=ERROR_STATUS_DURATION)
+                        positions = None
+
+                    if positions is not None:
+                        l.tx, l.ty, l.bx, l.by = positions
+
+                        # Force a sync after loading preset (applied once at the start of the next frame)
+                        self._dirty = True
+                        self._pending_sync = True
                         self.show_status(f"Loaded preset: {name}", "success")
-                        self.m_locked = True
-                    if d_btn.collidepoint(mx, my):
-                        logger.info(f"Deleting preset: {name}")
+                    self.m_locked = True
+                elif PRESET_DELETE_BUTTON_X <= mx < PRESET_DELETE_BUTTON_X + PRESET_BUTTON_WIDTH:
+                    logger.info("Deleting preset: %s", name)
+                    try:
                         self.l.store.delete_preset(name)
                         self.invalidate_preset_cache()  # Refresh cache after deletion
                         self.show_status(f"Deleted preset: {name}", "warning")
-                        self.m_locked = True
-
-                y_offset += PRESET_ROW_SPACING
-
-            # Handle Save button click and input field
-            if m_click and not self.m_locked:
-                if input_rect.collidepoint(mx, my):
-                    if not self.active_input:
-                        logger.debug("Activated preset name input field")
-                    self.active_input = True
-                    self.active_slider_input = None
-                if save_btn.collidepoint(mx, my):
-                    try:
-                        logger.info(f"Saving preset: {self.preset_name}")
-                        self.l.store.save_preset(
-                            self.preset_name,
-                            {
-                                "tx": self.l.tx,
-                                "ty": self.l.ty,
-                                "bx": self.l.bx,
-                                "by": self.l.by,
-                                "global_scale": self.l.launch_scale,
-                            },
-                        )
-                        self.invalidate_preset_cache()
-                        self.show_status(f"Saved preset: {self.preset_name}", "success")
-                        self.m_locked = True
-                    except ValueError as PresetSaveFail:
-                        logger.warning(f"Failed to save preset: {PresetSaveFail}")
-                        self.show_status(str(PresetSaveFail), "error", duration=ERROR_STATUS_DURATION)
-                        self.m_locked = True
-                    except Exception as PresetSaveError:
-                        logger.error(
-                            f"Unexpected error saving preset: {PresetSaveError}", exc_info=True
-                        )
-                        self.show_status("Failed to save preset", "error")
-                        self.m_locked = True
-
-            # Release mouse lock
-            if not m_click:
-                self.m_locked = False
-
+                    except OSError as PresetDeleteError:
+                        logger.error(f"Failed to delete preset '{name}': {PresetDeleteError}")
+                        self.show_status("Failed to delete preset", "error", duration=ERROR_STATUS_DURATION)
+                    self.m_locked = True
+
+        # Handle Save button click and input field
+        if m_click and not self.m_locked:
+            if hovered is input_rect:
+                if not self.active_input:
+                    logger.debug("Activated preset name input field")
+                self.active_input = True
+                self.active_slider_input = None
+                self._dirty = True
+            if hovered is save_btn:
+                try:
+                    logger.info("Saving preset: %s", self.preset_name)
+                    self.l.store.save_preset(
+                        self.preset_name,
+                        {
+                            "tx": self.l.tx,
+                            "ty": self.l.ty,
+                            "bx": self.l.bx,
+                            "by": self.l.by,
+                            "global_scale": self.l.launch_scale,
+                        },
+                    )
+                    self.invalidate_preset_cache()
+                    self.show_status(f"Saved preset: {self.preset_name}", "success")
+                    self.m_locked = True
+                except ValueError as PresetSaveFail:
+                    logger.warning(f"Failed to save preset: {PresetSaveFail}")
+                    self.show_status(str(PresetSaveFail), "error", duration=ERROR_STATUS_DURATION)
+                    self.m_locked = True
+                except OSError as PresetSaveError:
+                    logger.error(
+                        f"Error writing preset file: {PresetSaveError}", exc_info=True
+                    )
+                    self.show_status("Failed to save preset", "error")
+                    self.m_locked = True
+
+        # Release mouse lock
+        if not m_click:
+            self.m_locked = False
+
+        # Only regions that look different from the last pushed frame go to the display
+        last_states = self._region_states
+        if self._full_flip:
             pygame.display.flip()
-
-        except Exception as UIRenderError:
-            logger.error(f"Error during UI render: {UIRenderError}", exc_info=True)
+            self._full_flip = False
+        else:
+            changed = [
+                rect for rect, state, last in zip(self._update_rects, region_states, last_states)
+                if state != last
+            ]
+            if changed:
+                pygame.display.update(changed)
+        self._region_states = region_states
 
     def force_window_sync(self):
         """
@@ -962,10 +1553,20 @@ class PygameUI:
                 logger.warning("Cannot force sync - window handles not available")
                 return
 
-            # Bypass throttling
+            # Nothing to do if the exact same layout was already force-synced
+            l = self.l
+            sync_key = (
+                l.dock.hwnd_top, l.dock.hwnd_bottom, l.tx, l.ty, l.bx, l.by,
+                l.scrcpy.f_w1, l.scrcpy.f_h1, l.scrcpy.f_w2, l.scrcpy.f_h2,
+            )
+            if sync_key == self._last_sync_key:
+                logger.debug("Skipping force sync - layout unchanged")
+                return
+
+            # Bypass throttling and the unchanged-geometry check
             self.l.dock._last_sync = 0
+            self.l.dock.invalidate_geometry()
 
-            user32 = windll.user32
             logger.debug("Force syncing windows and ensuring visibility")
 
             # Show both windows
@@ -980,16 +1581,12 @@ class PygameUI:
                 is_docked=True,
             )
 
-            # Force window style refresh
-            user32.SetWindowPos(
-                self.l.dock.hwnd_top, 0, 0, 0, 0, 0,
-                SWP_NOZORDER | SWP_NOACTIVATE | SWP_FRAMECHANGED | SWP_NOMOVE | SWP_NOSIZE,
-            )
-            user32.SetWindowPos(
-                self.l.dock.hwnd_bottom, 0, 0, 0, 0, 0,
-                SWP_NOZORDER | SWP_NOACTIVATE | SWP_FRAMECHANGED | SWP_NOMOVE | SWP_NOSIZE,
-            )
+            # Plain repaint of both windows including their frames; nothing here recalculates the
+            # frame. That only happens in apply_docked_style(), and only when the style actually changes
+            user32.RedrawWindow(l.dock.hwnd_top, None, None, RDW_FRAME_REFRESH)
+            user32.RedrawWindow(l.dock.hwnd_bottom, None, None, RDW_FRAME_REFRESH)
 
+            self._last_sync_key = sync_key
             logger.info("Force window sync completed successfully")
 
         except Exception as WindowSyncError:
@@ -1003,57 +1600,103 @@ class PygameUI:
         Args:
             event: pygame event object
         """
+        # Any input or window event may change what is on screen
+        self._dirty = True
+        if event.type in (pygame.VIDEOEXPOSE, pygame.WINDOWEXPOSED):
+            self._full_flip = True
+        elif event.type in (pygame.WINDOWMINIMIZED, pygame.WINDOWHIDDEN):
+            logger.debug("Control panel hidden, pausing rendering")
+            self._visible = False
+        elif event.type in (pygame.WINDOWRESTORED, pygame.WINDOWSHOWN):
+            logger.debug("Control panel shown, resuming rendering")
+            self._visible = True
+            self._full_flip = True
+
+        # Only key presses into an active input box need handling below
+        if event.type != pygame.KEYDOWN or not (self.active_slider_input or self.active_input):
+            return
+
+        # Slider Keyboard Input
+        if self.active_slider_input:
+            handler = self._slider_key_handlers.get(event.key)
+            if handler:
+                handler()
+            else:
+                self._slider_append(event.unicode)
+
+        # Preset Name Input
+        else:
+            handler = self._name_key_handlers.get(event.key)
+            if handler:
+                handler()
+            else:
+                self._name_append(event.unicode)
+
+    def _slider_backspace(self):
+        """Remove the last character from the slider input box"""
+        self.input_buffer = self.input_buffer[:-1]
+
+    def _slider_commit(self):
+        """Apply the slider input box value, save it and close the box"""
         try:
-            if event.type == pygame.KEYDOWN:
-                # Slider Keyboard Input
-                if self.active_slider_input:
-                    if event.key == pygame.K_BACKSPACE:
-                        self.input_buffer = self.input_buffer[:-1]
-                    elif event.key in (pygame.K_RETURN, pygame.K_KP_ENTER):
-                        try:
-                            # Parse value based on slider data type
-                            if self.active_slider_input == "global_scale":
-                                new_val = float(self.input_buffer)
-                                if abs(new_val - self._original_scale) > SCALE_CHANGE_MIN_DETECTION:
-                                    self._scale_changed = True
-                            else:
-                                new_val = int(self.input_buffer)
+            # Parse value based on slider data type
+            if self.active_slider_input == "global_scale":
+                new_val = float(self.input_buffer)
+                if abs(new_val - self._original_scale) > SCALE_CHANGE_MIN_DETECTION:
+                    self._scale_changed = True
+            else:
+                new_val = int(self.input_buffer)
 
-                            setattr(self.l, self.active_slider_input, new_val)
-                            logger.info(
-                                f"Slider {self.active_slider_input} set to {new_val} via input box"
-                            )
+            self._slider_setters[self.active_slider_input](new_val)
+            logger.info(
+                "Slider %s set to %s via input box", self.active_slider_input, new_val
+            )
 
-                            # Save + sync
-                            if self.active_slider_input == "global_scale":
-                                self.l.save_scale()
-                            else:
-                                self.l.save_layout()
-                                self.force_window_sync()
-                        except ValueError:
-                            logger.warning(f"Invalid slider input: {self.input_buffer}")
-                            self.show_status("Invalid number", "error",
-                                             duration=SLIDER_ERROR_STATUS_DURATION)
-                        except Exception as SliderValueError:
-                            logger.error(f"Error setting slider value: {SliderValueError}")
-                        finally:
-                            self.active_slider_input = None
-
-                    # Allow digits, negative signs and decimal points
-                    elif (event.unicode.isdigit()
-                        or (event.unicode == "-" and len(self.input_buffer) == 0)
-                        or (event.unicode == "." and "." not in self.input_buffer)):
-                        self.input_buffer += event.unicode
-
-                # Preset Name Input
-                elif self.active_input:
-                    if event.key == pygame.K_BACKSPACE:
-                        self.preset_name = self.preset_name[:-1]
-                    elif event.key == pygame.K_RETURN:
-                        logger.debug("Preset name input deactivated via Enter")
-                        self.active_input = False
-                    else:
-                        self.preset_name += event.unicode
-
-        except Exception as EventHandlingError:
-            logger.error(f"Error handling event: {EventHandlingError}", exc_info=True)
+            # Save + sync
+            if self.active_slider_input == "global_scale":
+                self.l.save_scale()
+            else:
+                self.l.save_layout()
+                self._pending_sync = True
+        except ValueError:
+            logger.warning(f"Invalid slider input: {self.input_buffer}")
+            self.show_status("Invalid number", "error",
+                             duration=SLIDER_ERROR_STATUS_DURATION)
+        except OSError as SliderValueError:
+            logger.error(f"Error setting slider value: {SliderValueError}")
+        finally:
+            self.active_slider_input = None
+
+    def _slider_append(self, char):
+        """
+        Append a typed character to the slider input box
+
+        Args:
+            char: Unicode text of the key press
+        """
+        # Allow digits, negative signs and decimal points
+        if len(self.input_buffer) < SLIDER_INPUT_MAX_LENGTH and (
+            char in SLIDER_INPUT_DIGITS
+            or (char == "-" and not self.input_buffer)
+            or (char == "." and "." not in self.input_buffer)
+        ):
+            self.input_buffer += char
+
+    def _name_backspace(self):
+        """Remove the last character from the preset name box"""
+        self.preset_name = self.preset_name[:-1]
+
+    def _name_commit(self):
+        """Close the preset name box"""
+        logger.debug("Preset name input deactivated via Enter")
+        self.active_input = False
+
+    def _name_append(self, char):
+        """
+        Append a typed character to the preset name box
+
+        Args:
+            char: Unicode text of the key press
+        """
+        if char and len(self.preset_name) < MAX_PRESET_NAME_LENGTH:
+            self.preset_name += char
@@ -31,13 +31,30 @@ dwmapi = ctypes.windll.dwmapi
 # Windows GUI Functions
 user32 = ctypes.windll.user32
 
+dwmapi.DwmSetWindowAttribute.argtypes = [wintypes.HWND, wintypes.DWORD, ctypes.c_void_p, wintypes.DWORD]
+dwmapi.DwmSetWindowAttribute.restype = wintypes.LONG  # HRESULT, kept as a plain int so failures stay non-fatal
+
 # Windows build version constants
+WINDOWS_BUILD_17763 = 17763  # Windows 10 1809, first build with a dark titlebar attribute
 WINDOWS_BUILD_18985 = 18985
 
 # Windows 10/11 dark mode attribute IDs
 DWMWA_USE_DARK_MODE_LEGACY = 19
 DWMWA_USE_IMMERSIVE_DARK_MODE = 20
 
+# The build can't change while running, so pick the dark mode attribute once at import
+WINDOWS_BUILD = sys.getwindowsversion().build
+DARK_MODE_SUPPORTED = WINDOWS_BUILD >= WINDOWS_BUILD_17763
+if WINDOWS_BUILD < WINDOWS_BUILD_18985:
+    DWMWA_USE_DARK_MODE = DWMWA_USE_DARK_MODE_LEGACY
+else:
+    DWMWA_USE_DARK_MODE = DWMWA_USE_IMMERSIVE_DARK_MODE
+
+# Attribute value passed to DwmSetWindowAttribute, with its pointer and size, shared by every call
+DARK_MODE_ON = wintypes.BOOL(True)
+DARK_MODE_ON_PTR = ctypes.byref(DARK_MODE_ON)
+DARK_MODE_ON_SIZE = ctypes.sizeof(DARK_MODE_ON)
+
 def enable_dark_titlebar(hwnd):
     """
     Enables dark mode titlebar for a specific window
@@ -45,19 +62,15 @@ def enable_dark_titlebar(hwnd):
     Args:
         hwnd: int, Handle to the window (HWND)
     """
+    # Older builds reject both attributes, so don't make the call at all
+    if not DARK_MODE_SUPPORTED:
+        return
+    if not hwnd:
+        logger.warning("enable_dark_titlebar called with null hwnd")
+        return
+
+    logger.debug("Enabling dark titlebar (build %s, attribute %s)", WINDOWS_BUILD, DWMWA_USE_DARK_MODE)
     try:
-        version = sys.getwindowsversion().build
-        logger.info(f"Build retrieved, running build {version}")
-
-        # Select appropriate dark mode attribute based on Windows version
-        if version < WINDOWS_BUILD_18985:
-            DWMWA_USE_DARK_MODE = DWMWA_USE_DARK_MODE_LEGACY
-        else:
-            DWMWA_USE_DARK_MODE = DWMWA_USE_IMMERSIVE_DARK_MODE
-
-        value = wintypes.BOOL(True)
-        dwmapi.DwmSetWindowAttribute(
-            hwnd, DWMWA_USE_DARK_MODE, ctypes.byref(value), ctypes.sizeof(value)
-        )
+        dwmapi.DwmSetWindowAttribute(hwnd, DWMWA_USE_DARK_MODE, DARK_MODE_ON_PTR, DARK_MODE_ON_SIZE)
     except Exception as DarkTitlebarError:
-        logger.warning(f"Dark titlebar error: {DarkTitlebarError}")
\ No newline at end of file
+        logger.warning("Dark titlebar error for hwnd %s: %s", hwnd, DarkTitlebarError)
\ No newline at end of file
@@ -20,6 +20,7 @@
 import ctypes
 import time
 import logging
+import threading
 from ctypes import wintypes
 
 # Setup logger for this module
@@ -29,7 +30,61 @@ logger = logging.getLogger(__name__)
 user32 = ctypes.windll.user32
 kernel32 = ctypes.windll.kernel32
 
-# Constants for GetWindowLong / SetWindowLong
+# Prototypes for the calls made on every sync, so ctypes doesn't infer argument types per call
+user32.SetWindowPos.argtypes = [wintypes.HWND, wintypes.HWND, ctypes.c_int, ctypes.c_int, ctypes.c_int,
+                                ctypes.c_int, wintypes.UINT]
+user32.SetWindowPos.restype = wintypes.BOOL
+user32.GetWindowRect.argtypes = [wintypes.HWND, ctypes.POINTER(wintypes.RECT)]
+user32.GetWindowRect.restype = wintypes.BOOL
+user32.MapWindowPoints.argtypes = [wintypes.HWND, wintypes.HWND, ctypes.POINTER(wintypes.RECT), wintypes.UINT]
+user32.MapWindowPoints.restype = ctypes.c_int
+
+# Window long accessors. 64-bit user32 exports the pointer-sized *LongPtrW variants; on 32-bit they
+# are only header macros for the LONG versions, which are pointer-sized there anyway
+if ctypes.sizeof(ctypes.c_void_p) == 8:
+    GetWindowLongPtr = user32.GetWindowLongPtrW
+    SetWindowLongPtr = user32.SetWindowLongPtrW
+else:
+    GetWindowLongPtr = user32.GetWindowLongW
+    SetWindowLongPtr = user32.SetWindowLongW
+GetWindowLongPtr.argtypes = [wintypes.HWND, ctypes.c_int]
+GetWindowLongPtr.restype = ctypes.c_ssize_t
+SetWindowLongPtr.argtypes = [wintypes.HWND, ctypes.c_int, ctypes.c_ssize_t]
+SetWindowLongPtr.restype = ctypes.c_ssize_t
+
+# Prototypes for the parenting and focus calls
+user32.SetParent.argtypes = [wintypes.HWND, wintypes.HWND]
+user32.SetParent.restype = wintypes.HWND
+user32.IsWindow.argtypes = [wintypes.HWND]
+user32.IsWindow.restype = wintypes.BOOL
+user32.GetWindowThreadProcessId.argtypes = [wintypes.HWND, ctypes.POINTER(wintypes.DWORD)]
+user32.GetWindowThreadProcessId.restype = wintypes.DWORD
+user32.AttachThreadInput.argtypes = [wintypes.DWORD, wintypes.DWORD, wintypes.BOOL]
+user32.AttachThreadInput.restype = wintypes.BOOL
+user32.SetForegroundWindow.argtypes = [wintypes.HWND]
+user32.SetForegroundWindow.restype = wintypes.BOOL
+user32.BringWindowToTop.argtypes = [wintypes.HWND]
+user32.BringWindowToTop.restype = wintypes.BOOL
+user32.SetActiveWindow.argtypes = [wintypes.HWND]
+user32.SetActiveWindow.restype = wintypes.HWND
+user32.SetFocus.argtypes = [wintypes.HWND]
+user32.SetFocus.restype = wintypes.HWND
+kernel32.GetCurrentThreadId.argtypes = []
+kernel32.GetCurrentThreadId.restype = wintypes.DWORD
+user32.keybd_event.argtypes = [wintypes.BYTE, wintypes.BYTE, wintypes.DWORD, ctypes.c_void_p]
+user32.keybd_event.restype = None
+
+# Deferred window positioning, so both windows move in a single screen refresh
+HDWP = wintypes.HANDLE
+user32.BeginDeferWindowPos.argtypes = [ctypes.c_int]
+user32.BeginDeferWindowPos.restype = HDWP
+user32.DeferWindowPos.argtypes = [HDWP, wintypes.HWND, wintypes.HWND, ctypes.c_int, ctypes.c_int, ctypes.c_int,
+                                  ctypes.c_int, wintypes.UINT]
+user32.DeferWindowPos.restype = HDWP
+user32.EndDeferWindowPos.argtypes = [HDWP]
+user32.EndDeferWindowPos.restype = wintypes.BOOL
+
+# Constants for GetWindowLongPtr / SetWindowLongPtr
 GWL_STYLE = -16  # Standard window style
 GWL_EXSTYLE = -20  # Extended window style
 
@@ -58,11 +113,24 @@ SWP_NOMOVE = 0x0002  # Don't move
 SWP_NOSIZE = 0x0001  # Don't resize
 SWP_NOCOPYBITS = 0x0100  # Force full redraw
 
+# Combined SetWindowPos flags, OR'd once here rather than on every call
+SWP_SYNC_FLAGS = SWP_NOZORDER | SWP_NOACTIVATE | SWP_NOCOPYBITS  # Move/resize without z-order, focus or bit copy
+SWP_FRAME_REFRESH_FLAGS = SWP_NOZORDER | SWP_NOACTIVATE | SWP_FRAMECHANGED | SWP_NOMOVE | SWP_NOSIZE  # Style refresh only
+
+# Synthesized key input
+VK_MENU = 0x12  # Alt key
+KEYEVENTF_KEYUP = 0x0002  # Key release
+
 # Timing constants
 MIN_SYNC_INTERVAL = 0.016  # Minimum time between sync operations (60 FPS)
+MAX_IDLE_SYNC_INTERVAL = 0.2  # Longest interval the throttle backs off to while the target is unchanged
+IDLE_SYNC_TICKS_PER_STEP = 10  # Unchanged syncs before the interval doubles again
+MAX_IDLE_SYNC_BACKOFF_SHIFT = 4  # Cap on the number of doublings
 THREAD_ATTACH_TIMEOUT = 0.5  # Timeout for thread attachment operations (seconds)
-DETACH_RETRY_DELAY = 0.01  # Delay between detach retry attempts (seconds)
-MAX_DETACH_ATTEMPTS = 3  # Maximum number of detach retry attempts
+
+# Deferred positioning
+DEFERRED_WINDOW_COUNT = 2  # Top and bottom window are positioned together
+RECT_POINT_COUNT = 2  # A RECT is two POINTs for MapWindowPoints
 
 
 # Main Dock Manager Class
@@ -80,10 +148,66 @@ class Win32Dock:
         self.hwnd_container = None
         self.hwnd_top = None
         self.hwnd_bottom = None
-        self._last_sync = 0
+        self._last_sync = 0.0  # time.monotonic() of the last applied sync
+        self._sync_warning_logged = False  # Missing-handles message already logged for this gap
         self._min_sync_interval = MIN_SYNC_INTERVAL
+
+        # sync() runs on the UI thread, but the docking monitor swaps handles and invalidates the
+        # caches below from its own thread; the lock keeps the two from interleaving
+        self._sync_lock = threading.Lock()
+
+        # Last requested target, the last one actually applied, and how many syncs in a row have
+        # repeated an applied target; the throttle interval backs off while the layout is at rest
+        # and snaps back on any change
+        self._last_target = None
+        self._applied_target = None
+        self._idle_ticks = 0
+
+        # (hwnd_top, hwnd_bottom, top geometry, bottom geometry) last pushed to the OS, so
+        # unchanged syncs don't send SetWindowPos at all
+        self._last_geometry = None
+
+        # Container's screen position (window rect top-left), pushed by the container's window
+        # procedure on every move. None until known, in which case it is read once with GetWindowRect
+        self._container_origin = None
         logger.debug("Win32Dock initialized with null window handles")
 
+    def set_container_origin(self, x, y):
+        """
+        Record the container's new screen position
+
+        Args:
+            x, y: Top-left corner of the container's window rect in screen coordinates
+        """
+        self._container_origin = (x, y)
+
+    def refresh_container_origin(self):
+        """
+        Read the container's screen position with GetWindowRect, for when no move
+        has been reported yet
+
+        Returns:
+            bool: True if the position was read
+        """
+        rect = wintypes.RECT()
+        if not user32.GetWindowRect(self.hwnd_container, ctypes.byref(rect)):
+            logger.warning(f"GetWindowRect failed for container (hwnd={self.hwnd_container})")
+            return False
+        self._container_origin = (rect.left, rect.top)
+        return True
+
+    def invalidate_geometry(self):
+        """
+        Forget the last pushed geometry so the next sync moves the windows even if
+        the target is unchanged. Call after anything outside sync() restyles,
+        reparents or moves the docked windows
+        """
+        with self._sync_lock:
+            self._last_geometry = None
+            self._last_target = None
+            self._applied_target = None
+            self._idle_ticks = 0
+
     def sync(self, tx, ty, bx, by, w1, h1, w2, h2, is_docked=True):
         """
         Moves and resizes both embedded windows
@@ -95,78 +219,88 @@ class Win32Dock:
             w2, h2: bottom window width/height
             is_docked: whether windows are docked inside container
         """
+        # Layout values can arrive as floats from slider drags; convert them once here so the
+        # throttle target, the geometry cache and the Win32 calls all see the same ints
+        tx, ty, bx, by = int(tx), int(ty), int(bx), int(by)
+        w1, h1, w2, h2 = int(w1), int(h1), int(w2), int(h2)
+
+        with self._sync_lock:
+            # Repeating a target that has already been applied stretches the throttle interval,
+            # doubling every IDLE_SYNC_TICKS_PER_STEP repeats up to MAX_IDLE_SYNC_INTERVAL. Any change,
+            # including is_docked, resets it, and a target still held back never backs off
+            target = (tx, ty, bx, by, w1, h1, w2, h2, is_docked)
+            if target != self._last_target:
+                self._last_target = target
+                self._idle_ticks = 0
+            elif target == self._applied_target:
+                self._idle_ticks += 1
+            shift = min(self._idle_ticks // IDLE_SYNC_TICKS_PER_STEP, MAX_IDLE_SYNC_BACKOFF_SHIFT)
+            interval = min(MAX_IDLE_SYNC_INTERVAL, self._min_sync_interval * (1 << shift))
+
+            # Throttle rapid updates. A target skipped here isn't lost: the main loop calls sync()
+            # at least once per frame with the current layout, so the final position of a burst
+            # is applied by the first call after the interval, always on this thread
+            now = time.monotonic()
+            if now - self._last_sync < interval:
+                return
+            self._last_sync = now
+            self._applied_target = target
+            self._apply_sync(tx, ty, bx, by, w1, h1, w2, h2, is_docked)
+
+    def _apply_sync(self, tx, ty, bx, by, w1, h1, w2, h2, is_docked):
+        """
+        Push one sync target to the windows. Called with _sync_lock held
 
-        # Throttle rapid updates
-        now = time.time()
-        if now - self._last_sync < self._min_sync_interval:
-            return
-        self._last_sync = now
-
+        Parameters:
+            Same as sync(), already converted to ints
+        """
         if not (self.hwnd_top and self.hwnd_bottom):
-            # Don't spam logs - only log first time
-            if not hasattr(self, "_sync_warning_logged"):
+            # Don't spam logs - only log once until the handles are back
+            if not self._sync_warning_logged:
                 logger.debug("Sync skipped: window handles not available yet")
                 self._sync_warning_logged = True
             return
+        if self._sync_warning_logged:
+            self._sync_warning_logged = False
 
         try:
             # Flags for SetWindowPos: don't change z-order, don't activate, don't copy bits
-            flags = SWP_NOZORDER | SWP_NOACTIVATE | SWP_NOCOPYBITS
+            flags = SWP_SYNC_FLAGS
 
             if is_docked:
                 # Child windows are drawn relative to the container
                 logger.debug(
-                    f"Syncing docked windows - Top: ({tx}, {ty}, {w1}x{h1}), Bottom: ({bx}, {by}, {w2}x{h2})"
+                    "Syncing docked windows - Top: (%s, %s, %sx%s), Bottom: (%s, %s, %sx%s)",
+                    tx, ty, w1, h1, bx, by, w2, h2,
                 )
 
-                result_top = user32.SetWindowPos(
-                    self.hwnd_top, 0, int(tx), int(ty), int(w1), int(h1), flags
+                self._position_pair(
+                    (tx, ty, w1, h1),
+                    (bx, by, w2, h2),
+                    flags,
+                    self.hwnd_container,
                 )
-                if not result_top:
-                    logger.warning(
-                        f"SetWindowPos failed for top window (hwnd={self.hwnd_top})"
-                    )
-
-                result_bottom = user32.SetWindowPos(
-                    self.hwnd_bottom, 0, int(bx), int(by), int(w2), int(h2), flags
-                )
-                if not result_bottom:
-                    logger.warning(
-                        f"SetWindowPos failed for bottom window (hwnd={self.hwnd_bottom})"
-                    )
 
             else:
                 # For undocked mode, offset is decided by container's screen position
                 if self.hwnd_container:
-                    rect = wintypes.RECT()
-                    if not user32.GetWindowRect(
-                        self.hwnd_container, ctypes.byref(rect)
-                    ):
-                        logger.warning(
-                            f"GetWindowRect failed for container (hwnd={self.hwnd_container})"
-                        )
+                    if self._container_origin is None and not self.refresh_container_origin():
                         return
+                    left, top = self._container_origin
 
-                    screen_tx = rect.left + int(tx)
-                    screen_ty = rect.top + int(ty)
-                    screen_bx = rect.left + int(bx)
-                    screen_by = rect.top + int(by)
+                    screen_tx = left + tx
+                    screen_ty = top + ty
+                    screen_bx = left + bx
+                    screen_by = top + by
 
                     logger.debug(
-                        f"Syncing undocked windows - Top: ({screen_tx}, {screen_ty}), "
-                        f"Bottom: ({screen_bx}, {screen_by})"
+                        "Syncing undocked windows - Top: (%s, %s), Bottom: (%s, %s)",
+                        screen_tx, screen_ty, screen_bx, screen_by,
                     )
 
-                    user32.SetWindowPos(
-                        self.hwnd_top, 0, screen_tx, screen_ty, int(w1), int(h1), flags
-                    )
-                    user32.SetWindowPos(
-                        self.hwnd_bottom,
-                        0,
-                        screen_bx,
-                        screen_by,
-                        int(w2),
-                        int(h2),
+                    self._position_pair(
+                        (screen_tx, screen_ty, w1, h1),
+                        (screen_bx, screen_by, w2, h2),
                         flags,
                     )
                 else:
@@ -175,6 +309,70 @@ class Win32Dock:
         except Exception as WindowSyncError:
             logger.error(f"Error during window sync: {WindowSyncError}", exc_info=True)
 
+    def _position_pair(self, top, bottom, flags, parent=None):
+        """
+        Move and resize both windows in one deferred batch, so they are
+        repainted in a single screen refresh instead of one after the other.
+        Falls back to two SetWindowPos calls if the batch can't be built or applied.
+        Does nothing if both windows were already given this exact geometry and
+        are still there
+
+        Args:
+            top: (x, y, width, height) for the top window
+            bottom: (x, y, width, height) for the bottom window
+            flags: SetWindowPos flags applied to both windows
+            parent: Window the coordinates are relative to, or None for screen coordinates
+        """
+        geometry = (self.hwnd_top, self.hwnd_bottom, top, bottom)
+        if geometry == self._last_geometry:
+            # scrcpy resizes its own window (e.g. on device rotation) and undocked windows can be
+            # dragged, so only skip the move while both windows still sit where they were put
+            if (self._window_at(self.hwnd_top, top, parent)
+                    and self._window_at(self.hwnd_bottom, bottom, parent)):
+                return
+            logger.debug("Window moved or resized outside sync, re-applying layout")
+
+        hdwp = user32.BeginDeferWindowPos(DEFERRED_WINDOW_COUNT)
+        if hdwp:
+            # DeferWindowPos frees the batch itself when it fails
+            hdwp = user32.DeferWindowPos(hdwp, self.hwnd_top, None, *top, flags)
+        if hdwp:
+            hdwp = user32.DeferWindowPos(hdwp, self.hwnd_bottom, None, *bottom, flags)
+        if hdwp and user32.EndDeferWindowPos(hdwp):
+            self._last_geometry = geometry
+            return
+
+        logger.debug("Deferred window positioning failed, falling back to SetWindowPos")
+        moved = True
+        if not user32.SetWindowPos(self.hwnd_top, None, *top, flags):
+            logger.warning(f"SetWindowPos failed for top window (hwnd={self.hwnd_top})")
+            moved = False
+        if not user32.SetWindowPos(self.hwnd_bottom, None, *bottom, flags):
+            logger.warning(f"SetWindowPos failed for bottom window (hwnd={self.hwnd_bottom})")
+            moved = False
+        # Only remember geometry that actually reached both windows, so failures are retried
+        self._last_geometry = geometry if moved else None
+
+    @staticmethod
+    def _window_at(hwnd, geometry, parent):
+        """
+        Check whether a window currently has the given position and size
+
+        Args:
+            hwnd: Window to check
+            geometry: (x, y, width, height) as passed to SetWindowPos
+            parent: Window the coordinates are relative to, or None for screen coordinates
+
+        Returns:
+            bool: True if the window rect matches, False if it differs or can't be read
+        """
+        rect = wintypes.RECT()
+        if not user32.GetWindowRect(hwnd, ctypes.byref(rect)):
+            return False
+        if parent:
+            user32.MapWindowPoints(None, parent, ctypes.byref(rect), RECT_POINT_COUNT)
+        return (rect.left, rect.top, rect.right - rect.left, rect.bottom - rect.top) == geometry
+
 
 # Window Style Transformers
 def apply_docked_style(hwnd):
@@ -195,12 +393,13 @@ def apply_docked_style(hwnd):
         logger.info(f"Applying docked style to window {hwnd}")
 
         # Get current style
-        style = user32.GetWindowLongW(hwnd, GWL_STYLE)
+        style = GetWindowLongPtr(hwnd, GWL_STYLE)
         if not style:
-            logger.error(f"GetWindowLongW failed for hwnd {hwnd}")
+            logger.error(f"GetWindowLongPtr failed for hwnd {hwnd}")
             return
 
-        logger.debug(f"Current window style: 0x{style:08x}")
+        logger.debug("Current window style: 0x%08x", style)
+        old_style = style
 
         # Remove all decorations
         style &= ~(
@@ -215,12 +414,17 @@ def apply_docked_style(hwnd):
         # Add child mode + clipping
         style |= WS_CHILD | WS_VISIBLE | WS_CLIPCHILDREN | WS_CLIPSIBLINGS
 
-        logger.debug(f"New window style: 0x{style:08x}")
+        # Already docked: skip the style write and the costly non-client frame refresh
+        if style == old_style:
+            logger.debug("Window %s already has the docked style", hwnd)
+            return
+
+        logger.debug("New window style: 0x%08x", style)
 
         # Apply new style
-        result = user32.SetWindowLongW(hwnd, GWL_STYLE, style)
+        result = SetWindowLongPtr(hwnd, GWL_STYLE, style)
         if not result:
-            logger.warning(f"SetWindowLongW may have failed for hwnd {hwnd}")
+            logger.warning(f"SetWindowLongPtr may have failed for hwnd {hwnd}")
         else:
             logger.debug("Window style applied successfully")
 
@@ -229,14 +433,13 @@ def apply_docked_style(hwnd):
 
     # Force Windows to recalculate the non-client area to prevent ghosting
     try:
-        logger.debug(f"Forcing frame change for hwnd {hwnd}")
+        logger.debug("Forcing frame change for hwnd %s", hwnd)
         result = user32.SetWindowPos(
-            hwnd, 0, 0, 0, 0, 0,
-            SWP_NOZORDER | SWP_NOACTIVATE | SWP_FRAMECHANGED | SWP_NOMOVE | SWP_NOSIZE)
+            hwnd, 0, 0, 0, 0, 0, SWP_FRAME_REFRESH_FLAGS)
         if not result:
             logger.warning(f"SetWindowPos frame change may have failed for hwnd {hwnd}")
         else:
-            logger.debug(f"Docked style applied successfully to hwnd {hwnd}")
+            logger.debug("Docked style applied successfully to hwnd %s", hwnd)
 
     except Exception as FrameForceError:
         logger.error(f"Error forcing frame change for hwnd {hwnd}: {FrameForceError}", exc_info=True)
@@ -257,39 +460,45 @@ def apply_undocked_style(hwnd):
         logger.info(f"Applying undocked style to window {hwnd}")
 
         # Get current style
-        style = user32.GetWindowLongW(hwnd, GWL_STYLE)
+        style = GetWindowLongPtr(hwnd, GWL_STYLE)
         if not style:
-            logger.error(f"GetWindowLongW failed for hwnd {hwnd}")
+            logger.error(f"GetWindowLongPtr failed for hwnd {hwnd}")
             return
 
-        logger.debug(f"Current window style: 0x{style:08x}")
+        logger.debug("Current window style: 0x%08x", style)
+        old_style = style
 
         # Remove child flag
         style &= ~WS_CHILD
 
         # Restore standard window
         style |= WS_OVERLAPPEDWINDOW
-
-        logger.debug(f"New window style: 0x{style:08x}")
+        style_changed = style != old_style
 
         # Apply new style
-        result = user32.SetWindowLongW(hwnd, GWL_STYLE, style)
-        if not result:
-            logger.warning(f"SetWindowLongW may have failed for hwnd {hwnd}")
-        else:
-            logger.debug("Window style applied successfully")
+        if style_changed:
+            logger.debug("New window style: 0x%08x", style)
+            result = SetWindowLongPtr(hwnd, GWL_STYLE, style)
+            if not result:
+                logger.warning(f"SetWindowLongPtr may have failed for hwnd {hwnd}")
+            else:
+                logger.debug("Window style applied successfully")
 
         # Detach from container
-        logger.debug(f"Detaching window {hwnd} from parent")
+        logger.debug("Detaching window %s from parent", hwnd)
         result = user32.SetParent(hwnd, None)
         if not result:
             logger.warning(f"SetParent may have failed for hwnd {hwnd}")
 
+        # Already undocked: the frame is unchanged, so skip the costly non-client refresh
+        if not style_changed:
+            logger.debug("Window %s already had the undocked style", hwnd)
+            return
+
         # Force windows to redraw borders/title bar
-        logger.debug(f"Forcing frame change for hwnd {hwnd}")
+        logger.debug("Forcing frame change for hwnd %s", hwnd)
         result = user32.SetWindowPos(
-            hwnd, 0, 0, 0, 0, 0,
-            SWP_NOZORDER | SWP_NOACTIVATE | SWP_FRAMECHANGED | SWP_NOMOVE | SWP_NOSIZE)
+            hwnd, 0, 0, 0, 0, 0, SWP_FRAME_REFRESH_FLAGS)
         if not result:
             logger.warning(f"SetWindowPos frame change may have failed for hwnd {hwnd}")
         else:
@@ -309,12 +518,12 @@ def set_foreground_with_attach(hwnd):
         return False
 
     try:
-        logger.debug(f"Attempting to set foreground window: {hwnd}")
+        logger.debug("Attempting to set foreground window: %s", hwnd)
 
         tid_cur = kernel32.GetCurrentThreadId()
         tid_target = user32.GetWindowThreadProcessId(hwnd, None)
 
-        logger.debug(f"Current thread: {tid_cur}, Target thread: {tid_target}")
+        logger.debug("Current thread: %s, Target thread: %s", tid_cur, tid_target)
 
         # Same thread - no attachment needed
         if tid_cur == tid_target:
@@ -341,7 +550,7 @@ def set_foreground_with_attach(hwnd):
                 logger.info(f"Window {hwnd} brought to foreground (no attachment needed)")
                 return True
         except Exception as e:
-            logger.debug(f"SetForegroundWindow without attachment failed: {e}")
+            logger.debug("SetForegroundWindow without attachment failed: %s", e)
 
         # WINDOWS 10 CHECK - Be extra cautious
         import sys
@@ -360,9 +569,24 @@ def set_foreground_with_attach(hwnd):
                 logger.warning(f"Safe focus failed on Win10: {e}")
                 return False
 
-        # Windows 11+ - can try thread attachment
+        # Windows 11+ - a held Alt key counts as recent input, which lets SetForegroundWindow through
+        # without joining the two threads' input queues. Alt is only held across the call, since a
+        # full tap would open the menu bar or access keys of the window that currently has focus
+        try:
+            user32.keybd_event(VK_MENU, 0, 0, None)
+            try:
+                raised = user32.SetForegroundWindow(hwnd)
+            finally:
+                user32.keybd_event(VK_MENU, 0, KEYEVENTF_KEYUP, None)
+            if raised:
+                logger.info(f"Window {hwnd} brought to foreground (Alt key input)")
+                return True
+        except Exception as AltKeyForegroundError:
+            logger.debug("SetForegroundWindow with Alt key held failed: %s", AltKeyForegroundError)
+
+        # Then fall back to thread attachment
         attached = False
-        attach_timeout = time.time() + THREAD_ATTACH_TIMEOUT
+        attach_timeout = time.monotonic() + THREAD_ATTACH_TIMEOUT
 
         try:
             attached = bool(user32.AttachThreadInput(tid_cur, tid_target, True))
@@ -373,7 +597,7 @@ def set_foreground_with_attach(hwnd):
             logger.debug("Thread input queues attached successfully")
 
             # Quick focus with timeout check
-            if time.time() < attach_timeout:
+            if time.monotonic() < attach_timeout:
                 try:
                     user32.SetForegroundWindow(hwnd)
                     user32.SetActiveWindow(hwnd)
@@ -389,23 +613,16 @@ def set_foreground_with_attach(hwnd):
             return False
 
         finally:
-            # CRITICAL: Always detach with multiple attempts and timeout
+            # CRITICAL: Always detach. A failed detach doesn't succeed on retry (the queues
+            # were never or are no longer joined), so it is attempted once without sleeping
             if attached:
-                detach_success = False
-                for attempt in range(MAX_DETACH_ATTEMPTS):
-                    try:
-                        # Add small delay before detach to prevent race condition
-                        time.sleep(DETACH_RETRY_DELAY)
-                        detach_result = user32.AttachThreadInput(tid_cur, tid_target, False)
-                        if detach_result:
-                            logger.debug(f"Thread input queues detached (attempt {attempt + 1})")
-                            detach_success = True
-                            break
-                    except Exception as DetachError:
-                        logger.error(f"Detach attempt {attempt + 1} failed: {DetachError}")
-
-                if not detach_success:
-                    logger.critical("FAILED TO DETACH THREAD INPUT - SYSTEM MAY BE UNSTABLE")
+                try:
+                    if user32.AttachThreadInput(tid_cur, tid_target, False):
+                        logger.debug("Thread input queues detached")
+                    else:
+                        logger.critical("FAILED TO DETACH THREAD INPUT - SYSTEM MAY BE UNSTABLE")
+                except Exception as DetachError:
+                    logger.error(f"Detach attempt failed: {DetachError}")
 
         return False
 